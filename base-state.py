@@ -4,6 +4,11 @@ class State:
     """
     Base class for all game states.
     """
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Loggers are per class, so look each one up once
+        cls._class_logger = logging.getLogger(f"{__name__}.{cls.__name__}")
+    
     def __init__(self, game_state):
         """
         Initialize the state.
@@ -13,7 +18,7 @@ class State:
         """
         self.game_state = game_state
         self.state_machine = None  # Set by StateMachine.add_state
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.logger = type(self)._class_logger
     
     def enter(self):
         """
@@ -71,3 +76,5 @@ class State:
             return self.state_machine.set_state(state_name)
         self.logger.error("Cannot transition: no state machine set")
         return False
+
+State._class_logger = logging.getLogger(f"{__name__}.State")
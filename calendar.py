@@ -2,20 +2,49 @@ class Calendar:
     """
     Tracks game time with days, months, and years.
     """
+    # Season for each month, indexed directly by month number (1-12)
+    _SEASONS = (
+        None,
+        "winter", "winter",
+        "spring", "spring", "spring",
+        "summer", "summer", "summer",
+        "fall", "fall", "fall",
+        "winter"
+    )
+    
+    # Special dates in the game world, keyed by (month, day)
+    _SPECIAL_DATES = {
+        (1, 1): "New Year's Day",
+        (6, 15): "Midsummer Festival",
+        (12, 25): "Winter Solstice"
+    }
+    
     def __init__(self, day=1, month=1, year=1):
-        self.day = day
-        self.month = month
-        self.year = year
         self.days_per_month = 30  # Simplified calendar
         self.months_per_year = 12
-        self.total_days = 0  # Total days elapsed
+        # Days elapsed since day 1, month 1, year 1; day/month/year derive from it
+        self.total_days = ((year - 1) * self.months_per_year + (month - 1)) * self.days_per_month + (day - 1)
+        self._str_cache = None  # Cached to_string() result, None when stale
+    
+    @property
+    def day(self):
+        """int: Day of the month (1-based)."""
+        return self.total_days % self.days_per_month + 1
+    
+    @property
+    def month(self):
+        """int: Month of the year (1-based)."""
+        return self.total_days // self.days_per_month % self.months_per_year + 1
+    
+    @property
+    def year(self):
+        """int: Year (1-based)."""
+        return self.total_days // (self.days_per_month * self.months_per_year) + 1
     
     def reset(self):
         """Reset the calendar to day 1, month 1, year 1."""
-        self.day = 1
-        self.month = 1
-        self.year = 1
         self.total_days = 0
+        self._str_cache = None
     
     def advance(self, days=1):
         """
@@ -27,28 +56,16 @@ class Calendar:
         Returns:
             tuple: (days_elapsed, months_elapsed, years_elapsed)
         """
-        days_elapsed = 0
-        months_elapsed = 0
-        years_elapsed = 0
-        
+        prev_total = self.total_days
         self.total_days += days
-        self.day += days
-        
-        # Handle month overflow
-        while self.day > self.days_per_month:
-            self.day -= self.days_per_month
-            self.month += 1
-            months_elapsed += 1
-            
-            # Handle year overflow
-            if self.month > self.months_per_year:
-                self.month = 1
-                self.year += 1
-                years_elapsed += 1
+        self._str_cache = None
         
-        days_elapsed = days
+        # Count month and year boundaries crossed
+        days_per_year = self.days_per_month * self.months_per_year
+        months_elapsed = self.total_days // self.days_per_month - prev_total // self.days_per_month
+        years_elapsed = self.total_days // days_per_year - prev_total // days_per_year
         
-        return (days_elapsed, months_elapsed, years_elapsed)
+        return (days, months_elapsed, years_elapsed)
     
     def get_season(self):
         """
@@ -57,14 +74,7 @@ class Calendar:
         Returns:
             str: "winter", "spring", "summer", or "fall"
         """
-        if 3 <= self.month <= 5:
-            return "spring"
-        elif 6 <= self.month <= 8:
-            return "summer"
-        elif 9 <= self.month <= 11:
-            return "fall"
-        else:
-            return "winter"
+        return Calendar._SEASONS[self.month]
     
     def is_special_date(self):
         """
@@ -73,13 +83,9 @@ class Calendar:
         Returns:
             tuple: (bool, str) - (is_special, description)
         """
-        # Example special dates
-        if self.month == 1 and self.day == 1:
-            return (True, "New Year's Day")
-        elif self.month == 6 and self.day == 15:
-            return (True, "Midsummer Festival")
-        elif self.month == 12 and self.day == 25:
-            return (True, "Winter Solstice")
+        description = Calendar._SPECIAL_DATES.get((self.month, self.day))
+        if description is not None:
+            return (True, description)
         
         return (False, "")
     
@@ -90,7 +96,9 @@ class Calendar:
         Returns:
             str: Date string.
         """
-        return f"Day {self.day}, Month {self.month}, Year {self.year}"
+        if self._str_cache is None:
+            self._str_cache = f"Day {self.day}, Month {self.month}, Year {self.year}"
+        return self._str_cache
     
     def to_dict(self):
         """
@@ -117,10 +125,13 @@ class Calendar:
         Returns:
             Calendar: New Calendar instance.
         """
-        calendar = Calendar(
+        if "total_days" in data:
+            calendar = Calendar()
+            calendar.total_days = data["total_days"]
+            return calendar
+        
+        return Calendar(
             day=data.get("day", 1),
             month=data.get("month", 1),
             year=data.get("year", 1)
         )
-        calendar.total_days = data.get("total_days", 0)
-        return calendar
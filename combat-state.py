@@ -1,23 +1,64 @@
 import tcod
 import tcod.event as event
+import logging
 import random
+import types
+from collections import deque
+import numpy as np
 from src.states.state import State
+from src.engine.fleet import CONDITION_NAMES, CONDITION_DAMAGED
+
+# Render colors
+_TITLE_FG = (255, 255, 0)
+_GRID_FG = (50, 50, 100)
+_LOG_FG = (100, 100, 100)
+_LOG_TITLE_FG = (200, 200, 100)
+_PLAYER_FG = (0, 0, 255)
+_PLAYER_HL = (100, 200, 255)
+_PLAYER_DMG = (100, 100, 200)
+_ENEMY_FG = (255, 0, 0)
+_ENEMY_HL = (255, 200, 100)
+_ENEMY_DMG = (200, 100, 100)
+_WIND_FG = (150, 150, 255)
+_STATS_FG = (200, 200, 200)
+_SHIP_NAME_FG = (200, 200, 255)
+_ACTION_FG = (150, 150, 150)
+_ACTION_SELECTED_FG = (255, 255, 255)
+
+# Enemy ship pools (placeholder for now)
+_ENEMY_TYPES = np.array(["Sloop", "Brigantine", "Frigate"], dtype=object)
+_ENEMY_NAMES = np.array(["Bounty Hunter", "Royal Guard", "Sea Serpent", "Thunder"], dtype=object)
 
 class CombatState(State):
     """
     Combat state - handles ship-to-ship combat.
     """
+    _ACTIONS = (
+        "Move",
+        "Fire Cannons",
+        "Prepare to Board",
+        "Evasive Maneuvers",
+        "Intimidate",
+        "End Turn"
+    )
+    _ACTION_COUNT = len(_ACTIONS)
+    
+    # Number of combat log lines shown (and kept)
+    _LOG_LINES = 6
+    
+    _COMMANDS_TEXT = "Space: Select Action | Tab: Next Ship | T: Select Target | Esc: Retreat"
+    
     def __init__(self, game_state):
         super().__init__(game_state)
-        self.enemy_ships = []
-        self.player_ships = []
+        self._allocate_ships(0, 0)
         self.current_ship_index = 0
-        self.current_action = None
-        self.combat_log = []
+        self.current_action_idx = None  # Index into _ACTIONS
+        self.combat_log = deque(maxlen=CombatState._LOG_LINES)
         self.turn = 0
         self.phase = "player"  # "player" or "enemy"
         self.selected_target = 0
         self.camera_offset = [0, 0]
+        self._layout = None  # Screen geometry, built on first render
     
     def enter(self):
         super().enter()
@@ -33,315 +74,329 @@ class CombatState(State):
     def _initialize_combat(self):
         """Initialize the combat scenario."""
         # Reset combat state
-        self.combat_log = []
+        self.combat_log = deque(maxlen=CombatState._LOG_LINES)
         self.turn = 1
         self.phase = "player"
         self.selected_target = 0
         self.camera_offset = [0, 0]
+        self._rng = np.random.default_rng()
+        
+        fleet = self.game_state.player_fleet
+        rng = self._rng
+        num_enemies = min(len(fleet) + int(rng.integers(0, 2)), 3)
+        
+        self._allocate_ships(len(fleet), num_enemies)
         
         # Create player ships from fleet
-        self.player_ships = []
-        for ship in self.game_state.player_fleet:
-            combat_ship = {
-                "name": ship["name"],
-                "type": ship["type"],
-                "condition": ship["condition"],
-                "crew": ship["crew"],
-                "hull": 100,
-                "sails": 100,
-                "position": (0, 0),  # Will be set properly
-                "orientation": 0,    # 0-5 for hex directions
-                "has_acted": False
-            }
-            self.player_ships.append(combat_ship)
+        self.player_names.extend(fleet.names)
+        self.player_types.extend(fleet.types)
+        self.player_conditions.extend(CONDITION_NAMES[c] for c in fleet.conditions.tolist())
+        self.player_crew[:] = fleet.crew
         
         # Create enemy ships (placeholder for now)
-        self.enemy_ships = []
-        enemy_types = ["Sloop", "Brigantine", "Frigate"]
-        enemy_names = ["Bounty Hunter", "Royal Guard", "Sea Serpent", "Thunder"]
+        self.enemy_types.extend(rng.choice(_ENEMY_TYPES, size=num_enemies).tolist())
+        self.enemy_names.extend(f"The {name}" for name in rng.choice(_ENEMY_NAMES, size=num_enemies).tolist())
+        self.enemy_conditions.extend(["Good"] * num_enemies)
+        self.enemy_crew[:] = 15 + rng.integers(0, 11, size=num_enemies)
+        
+        # Position ships
+        self.player_pos[:, 0] = 2
+        self.player_pos[:, 1] = np.arange(len(fleet)) * 3
+        self.enemy_pos[:, 0] = 10  # Will be adjusted
+        self.enemy_pos[:, 1] = np.arange(num_enemies) * 3
+        self.enemy_orientation[:] = 3  # Facing player
         
-        num_enemies = min(len(self.game_state.player_fleet) + random.randint(0, 1), 3)
+        # Log combat start
+        self._add_to_log(f"Combat begins! {len(self.player_names)} ships vs {len(self.enemy_names)} enemy vessels.")
+        self._add_to_log("Player's turn. Select a ship and action.")
+    
+    def _allocate_ships(self, num_players, num_enemies):
+        """
+        Allocate the per-ship combat arrays for both sides.
+        
+        Ships are stored structure-of-arrays style: numeric stats live in
+        parallel NumPy arrays indexed by ship, while names, types and
+        conditions are kept in plain lists. Which player ships have acted
+        this turn is tracked in ``acted_mask``, bit i meaning ship i.
+        Sunk or surrendered ships are only flagged in the ``*_alive``
+        arrays and are dropped by ``_compact_ships`` at the end of a turn.
+        
+        Args:
+            num_players (int): Number of player ships.
+            num_enemies (int): Number of enemy ships.
+        """
+        self.player_names = []
+        self.player_types = []
+        self.player_conditions = []
+        self.player_crew = np.zeros(num_players, dtype=np.int16)
+        self.player_hull = np.full(num_players, 100, dtype=np.int16)
+        self.player_sails = np.full(num_players, 100, dtype=np.int16)
+        self.player_pos = np.zeros((num_players, 2), dtype=np.int16)
+        self.player_orientation = np.zeros(num_players, dtype=np.int8)  # 0-5 for hex directions
+        self.player_alive = np.ones(num_players, dtype=bool)
+        self.player_stats_text = [None] * num_players  # Cached stat panel lines, None when stale
+        self.acted_mask = 0
+        
+        self.enemy_names = []
+        self.enemy_types = []
+        self.enemy_conditions = []
+        self.enemy_crew = np.zeros(num_enemies, dtype=np.int16)
+        self.enemy_hull = np.full(num_enemies, 100, dtype=np.int16)
+        self.enemy_sails = np.full(num_enemies, 100, dtype=np.int16)
+        self.enemy_pos = np.zeros((num_enemies, 2), dtype=np.int16)
+        self.enemy_orientation = np.zeros(num_enemies, dtype=np.int8)
+        self.enemy_has_acted = np.zeros(num_enemies, dtype=bool)
+        self.enemy_alive = np.ones(num_enemies, dtype=bool)
+    
+    def _compact_ships(self):
+        """Drop sunk and surrendered ships from the combat arrays."""
+        player_alive = self.player_alive
+        if not player_alive.all():
+            self.current_ship_index = int(np.count_nonzero(player_alive[:self.current_ship_index]))
+            self.player_names = [n for n, alive in zip(self.player_names, player_alive) if alive]
+            self.player_types = [t for t, alive in zip(self.player_types, player_alive) if alive]
+            self.player_conditions = [c for c, alive in zip(self.player_conditions, player_alive) if alive]
+            self.player_stats_text = [t for t, alive in zip(self.player_stats_text, player_alive) if alive]
+            self.player_crew = self.player_crew[player_alive]
+            self.player_hull = self.player_hull[player_alive]
+            self.player_sails = self.player_sails[player_alive]
+            self.player_pos = self.player_pos[player_alive]
+            self.player_orientation = self.player_orientation[player_alive]
+            self.player_alive = self.player_alive[player_alive]
+            self.current_ship_index = min(self.current_ship_index, len(self.player_names) - 1) if self.player_names else 0
+        
+        enemy_alive = self.enemy_alive
+        if not enemy_alive.all():
+            self.selected_target = int(np.count_nonzero(enemy_alive[:self.selected_target]))
+            self.enemy_names = [n for n, alive in zip(self.enemy_names, enemy_alive) if alive]
+            self.enemy_types = [t for t, alive in zip(self.enemy_types, enemy_alive) if alive]
+            self.enemy_conditions = [c for c, alive in zip(self.enemy_conditions, enemy_alive) if alive]
+            self.enemy_crew = self.enemy_crew[enemy_alive]
+            self.enemy_hull = self.enemy_hull[enemy_alive]
+            self.enemy_sails = self.enemy_sails[enemy_alive]
+            self.enemy_pos = self.enemy_pos[enemy_alive]
+            self.enemy_orientation = self.enemy_orientation[enemy_alive]
+            self.enemy_has_acted = self.enemy_has_acted[enemy_alive]
+            self.enemy_alive = self.enemy_alive[enemy_alive]
+            self.selected_target = min(self.selected_target, len(self.enemy_names) - 1) if self.enemy_names else 0
+    
+    @staticmethod
+    def _build_layout(console):
+        """
+        Compute the screen geometry for a console size.
         
-        for i in range(num_enemies):
-            ship_type = random.choice(enemy_types)
-            name = f"The {random.choice(enemy_names)}"
+        Args:
+            console (Console): tcod console being rendered to.
             
-            enemy_ship = {
-                "name": name,
-                "type": ship_type,
-                "condition": "Good",
-                "crew": 15 + random.randint(0, 10),
-                "hull": 100,
-                "sails": 100,
-                "position": (10, i * 3),  # Will be adjusted
-                "orientation": 3,         # Facing player
-                "has_acted": False
-            }
-            self.enemy_ships.append(enemy_ship)
-        
-        # Position player ships
-        for i, ship in enumerate(self.player_ships):
-            ship["position"] = (2, i * 3)
+        Returns:
+            SimpleNamespace: Positions and sizes of the combat panels.
+        """
+        width = console.width
+        height = console.height
         
-        # Log combat start
-        self._add_to_log(f"Combat begins! {len(self.player_ships)} ships vs {len(self.enemy_ships)} enemy vessels.")
-        self._add_to_log("Player's turn. Select a ship and action.")
+        # Tactical grid (placeholder)
+        grid_width = 60
+        grid_height = 30
+        grid_x = (width - grid_width) // 2
+        grid_y = 5
+        
+        return types.SimpleNamespace(
+            width=width,
+            height=height,
+            center_x=width // 2,
+            grid_x=grid_x,
+            grid_y=grid_y,
+            grid_width=grid_width,
+            grid_height=grid_height,
+            wind_x=grid_x + grid_width - 10,
+            wind_y=grid_y + 2,
+            log_x=5,
+            log_y=grid_y + grid_height + 2,
+            log_width=width - 10,
+            log_height=CombatState._LOG_LINES + 1,
+            actions_x=grid_x + grid_width + 2,
+            actions_y=grid_y,
+            actions_width=width - (grid_x + grid_width + 2) - 2,
+            stats_y=grid_y + CombatState._ACTION_COUNT + 5,
+            commands_y=height - 2
+        )
+    
+    @staticmethod
+    def _draw_ship_glyphs(console, origin_x, origin_y, pos, alive, hull, highlight,
+                          ship_char, fg_color, highlight_color, damaged_color):
+        """
+        Plot one side's ship glyphs straight into the console tile arrays.
+        
+        Args:
+            console (Console): tcod console to render to.
+            origin_x (int): Console x of grid position 0.
+            origin_y (int): Console y of grid position 0.
+            pos (ndarray): (N, 2) ship grid positions.
+            alive (ndarray): (N,) mask of ships still in combat.
+            hull (ndarray): (N,) hull values.
+            highlight (int): Index of the highlighted ship, or -1 for none.
+            ship_char (str): Glyph to draw.
+            fg_color (tuple): Normal ship color.
+            highlight_color (tuple): Highlighted ship color.
+            damaged_color (tuple): Damaged ship color (wins over highlight).
+        """
+        xs = pos[:, 0].astype(np.intp) + origin_x
+        ys = pos[:, 1].astype(np.intp) + origin_y
+        
+        colors = np.empty((len(xs), 3), dtype=np.uint8)
+        colors[:] = fg_color
+        if 0 <= highlight < len(xs):
+            colors[highlight] = highlight_color
+        colors[hull < 50] = damaged_color
+        
+        # Only plot visible ships inside the console
+        mask = alive & (xs >= 0) & (xs < console.width) & (ys >= 0) & (ys < console.height)
+        ys = ys[mask]
+        xs = xs[mask]
+        console.ch[ys, xs] = ord(ship_char)
+        console.fg[ys, xs] = colors[mask]
+    
+    def _select_next_target(self):
+        """Move the selected target to the next enemy ship still in combat."""
+        alive = np.flatnonzero(self.enemy_alive)
+        if alive.size:
+            # First alive enemy after the current target, wrapping around
+            later = alive[alive > self.selected_target]
+            self.selected_target = int(later[0] if later.size else alive[0])
     
     def update(self, delta_time):
         # Handle any automatic updates
         pass
     
     def render(self, console):
+        p = console.print
+        player_names = self.player_names
+        enemy_names = self.enemy_names
+        phase = self.phase
+        current_ship_index = self.current_ship_index
+        selected_target = self.selected_target
+        cam_x, cam_y = self.camera_offset
+        
+        # Geometry only depends on the console size
+        layout = self._layout
+        if layout is None or layout.width != console.width or layout.height != console.height:
+            layout = self._layout = self._build_layout(console)
+        
         # Clear console
         console.clear()
         
         # Draw combat header
-        turn_text = f"Turn: {self.turn} - {self.phase.capitalize()} Phase"
-        console.print(
-            console.width // 2,
+        turn_text = f"Turn: {self.turn} - {phase.capitalize()} Phase"
+        p(
+            layout.center_x,
             1,
             turn_text,
-            fg=(255, 255, 0),
+            fg=_TITLE_FG,
             bg=None,
             alignment=tcod.CENTER
         )
         
-        # Draw tactical grid (placeholder)
-        grid_width = 60
-        grid_height = 30
-        grid_x = (console.width - grid_width) // 2
-        grid_y = 5
+        # Draw tactical grid outline (placeholder)
+        console.draw_frame(
+            layout.grid_x, layout.grid_y, layout.grid_width + 1, layout.grid_height + 1,
+            clear=False, fg=_GRID_FG, bg=None
+        )
         
-        # Draw grid outline
-        for x in range(grid_width):
-            console.print(grid_x + x, grid_y, "─", fg=(50, 50, 100))
-            console.print(grid_x + x, grid_y + grid_height, "─", fg=(50, 50, 100))
-        
-        for y in range(grid_height):
-            console.print(grid_x, grid_y + y, "│", fg=(50, 50, 100))
-            console.print(grid_x + grid_width, grid_y + y, "│", fg=(50, 50, 100))
-        
-        # Draw corners
-        console.print(grid_x, grid_y, "┌", fg=(50, 50, 100))
-        console.print(grid_x + grid_width, grid_y, "┐", fg=(50, 50, 100))
-        console.print(grid_x, grid_y + grid_height, "└", fg=(50, 50, 100))
-        console.print(grid_x + grid_width, grid_y + grid_height, "┘", fg=(50, 50, 100))
-        
-        # Draw player ships
-        for i, ship in enumerate(self.player_ships):
-            x = grid_x + 5 + ship["position"][0] - self.camera_offset[0]
-            y = grid_y + 5 + ship["position"][1] - self.camera_offset[1]
-            
-            # Ship representation depends on type and orientation
-            ship_char = "P"  # Placeholder
-            fg_color = (0, 0, 255)  # Blue for player
-            
-            # Highlight current ship
-            if self.phase == "player" and i == self.current_ship_index:
-                fg_color = (100, 200, 255)
-                
-            # Show damaged ships differently
-            if ship["hull"] < 50:
-                fg_color = (100, 100, 200)
-            
-            console.print(
-                x,
-                y,
-                ship_char,
-                fg=fg_color,
-                bg=None
-            )
-            
-            # Show ship name
-            if self.phase == "player" and i == self.current_ship_index:
-                console.print(
-                    x,
-                    y - 1,
-                    ship["name"],
-                    fg=(100, 200, 255),
-                    bg=None
-                )
-        
-        # Draw enemy ships
-        for i, ship in enumerate(self.enemy_ships):
-            x = grid_x + 5 + ship["position"][0] - self.camera_offset[0]
-            y = grid_y + 5 + ship["position"][1] - self.camera_offset[1]
-            
-            # Ship representation
-            ship_char = "E"  # Placeholder
-            fg_color = (255, 0, 0)  # Red for enemy
-            
-            # Highlight targeted enemy
-            if self.phase == "player" and i == self.selected_target:
-                fg_color = (255, 200, 100)
-                
-            # Show damaged ships differently
-            if ship["hull"] < 50:
-                fg_color = (200, 100, 100)
-            
-            console.print(
-                x,
-                y,
-                ship_char,
-                fg=fg_color,
-                bg=None
-            )
-            
-            # Show ship name for targeted enemy
-            if self.phase == "player" and i == self.selected_target:
-                console.print(
-                    x,
-                    y - 1,
-                    ship["name"],
-                    fg=(255, 200, 100),
-                    bg=None
-                )
+        player_phase = phase == "player"
+        
+        # Ship origin on the console
+        origin_x = layout.grid_x + 5 - cam_x
+        origin_y = layout.grid_y + 5 - cam_y
+        
+        # Draw player ships, highlighting the current ship
+        current = current_ship_index if player_phase else -1
+        self._draw_ship_glyphs(
+            console, origin_x, origin_y, self.player_pos, self.player_alive, self.player_hull,
+            current, "P", _PLAYER_FG, _PLAYER_HL, _PLAYER_DMG
+        )
+        
+        # Show ship name
+        if 0 <= current < len(player_names) and self.player_alive[current]:
+            x, y = self.player_pos[current].tolist()
+            p(origin_x + x, origin_y + y - 1, player_names[current], fg=_PLAYER_HL, bg=None)
+        
+        # Draw enemy ships, highlighting the targeted enemy
+        target = selected_target if player_phase else -1
+        self._draw_ship_glyphs(
+            console, origin_x, origin_y, self.enemy_pos, self.enemy_alive, self.enemy_hull,
+            target, "E", _ENEMY_FG, _ENEMY_HL, _ENEMY_DMG
+        )
+        
+        # Show ship name for targeted enemy
+        if 0 <= target < len(enemy_names) and self.enemy_alive[target]:
+            x, y = self.enemy_pos[target].tolist()
+            p(origin_x + x, origin_y + y - 1, enemy_names[target], fg=_ENEMY_HL, bg=None)
         
         # Draw wind indicator (placeholder)
         wind_dir = "→"  # Placeholder
-        console.print(
-            grid_x + grid_width - 10,
-            grid_y + 2,
+        p(
+            layout.wind_x,
+            layout.wind_y,
             f"Wind: {wind_dir}",
-            fg=(150, 150, 255),
+            fg=_WIND_FG,
             bg=None
         )
         
-        # Draw combat log
-        log_x = 5
-        log_y = grid_y + grid_height + 2
-        log_width = console.width - 10
-        log_height = 7
-        
-        # Draw log border
-        for x in range(log_width):
-            console.print(log_x + x, log_y, "─", fg=(100, 100, 100))
-            console.print(log_x + x, log_y + log_height, "─", fg=(100, 100, 100))
-        
-        for y in range(log_height):
-            console.print(log_x, log_y + y, "│", fg=(100, 100, 100))
-            console.print(log_x + log_width, log_y + y, "│", fg=(100, 100, 100))
-        
-        # Draw corners
-        console.print(log_x, log_y, "┌", fg=(100, 100, 100))
-        console.print(log_x + log_width, log_y, "┐", fg=(100, 100, 100))
-        console.print(log_x, log_y + log_height, "└", fg=(100, 100, 100))
-        console.print(log_x + log_width, log_y + log_height, "┘", fg=(100, 100, 100))
+        # Draw combat log border
+        log_x = layout.log_x
+        log_y = layout.log_y
+        console.draw_frame(
+            log_x, log_y, layout.log_width + 1, layout.log_height + 1,
+            clear=False, fg=_LOG_FG, bg=None
+        )
         
         # Draw log title
-        console.print(
-            log_x + 2,
-            log_y,
-            "Combat Log",
-            fg=(200, 200, 100),
-            bg=None
-        )
+        p(log_x + 2, log_y, "Combat Log", fg=_LOG_TITLE_FG, bg=None)
         
         # Draw log entries (most recent first)
-        visible_log = self.combat_log[-log_height+1:] if len(self.combat_log) > log_height-1 else self.combat_log
-        for i, entry in enumerate(visible_log):
-            console.print(
-                log_x + 2,
-                log_y + i + 1,
-                entry,
-                fg=(200, 200, 200),
-                bg=None
-            )
+        for i, entry in enumerate(self.combat_log):
+            p(log_x + 2, log_y + i + 1, entry, fg=_STATS_FG, bg=None)
         
         # Draw actions menu if it's player's turn
-        if self.phase == "player":
-            actions_x = grid_x + grid_width + 2
-            actions_y = grid_y
-            actions_width = console.width - actions_x - 2
-            
-            console.print(
-                actions_x,
-                actions_y,
-                "Actions",
-                fg=(255, 255, 0),
-                bg=None
-            )
+        if player_phase:
+            actions_x = layout.actions_x
+            actions_y = layout.actions_y
             
-            actions = [
-                "Move",
-                "Fire Cannons",
-                "Prepare to Board",
-                "Evasive Maneuvers",
-                "Intimidate",
-                "End Turn"
-            ]
+            p(actions_x, actions_y, "Actions", fg=_TITLE_FG, bg=None)
             
-            for i, action in enumerate(actions):
-                fg = (255, 255, 255) if action == self.current_action else (150, 150, 150)
-                
-                console.print(
-                    actions_x,
-                    actions_y + i + 2,
-                    action,
-                    fg=fg,
-                    bg=None
-                )
+            current_action_idx = self.current_action_idx
+            for i, action in enumerate(CombatState._ACTIONS):
+                fg = _ACTION_SELECTED_FG if i == current_action_idx else _ACTION_FG
+                p(actions_x, actions_y + i + 2, action, fg=fg, bg=None)
             
             # Draw current ship stats
-            if self.player_ships:
-                ship = self.player_ships[self.current_ship_index]
-                stats_y = actions_y + len(actions) + 5
+            if player_names:
+                idx = current_ship_index
+                stats_y = layout.stats_y
                 
-                console.print(
-                    actions_x,
-                    stats_y,
-                    "Ship Info",
-                    fg=(255, 255, 0),
-                    bg=None
-                )
+                p(actions_x, stats_y, "Ship Info", fg=_TITLE_FG, bg=None)
+                p(actions_x, stats_y + 2, player_names[idx], fg=_SHIP_NAME_FG, bg=None)
                 
-                console.print(
-                    actions_x,
-                    stats_y + 2,
-                    ship["name"],
-                    fg=(200, 200, 255),
-                    bg=None
-                )
+                # Stat lines only change when the ship is damaged
+                stats_text = self.player_stats_text[idx]
+                if stats_text is None:
+                    stats_text = (
+                        f"Type: {self.player_types[idx]}",
+                        f"Hull: {self.player_hull[idx]}%",
+                        f"Sails: {self.player_sails[idx]}%",
+                        f"Crew: {self.player_crew[idx]}"
+                    )
+                    self.player_stats_text[idx] = stats_text
                 
-                console.print(
-                    actions_x,
-                    stats_y + 3,
-                    f"Type: {ship['type']}",
-                    fg=(200, 200, 200),
-                    bg=None
-                )
-                
-                console.print(
-                    actions_x,
-                    stats_y + 4,
-                    f"Hull: {ship['hull']}%",
-                    fg=(200, 200, 200),
-                    bg=None
-                )
-                
-                console.print(
-                    actions_x,
-                    stats_y + 5,
-                    f"Sails: {ship['sails']}%",
-                    fg=(200, 200, 200),
-                    bg=None
-                )
-                
-                console.print(
-                    actions_x,
-                    stats_y + 6,
-                    f"Crew: {ship['crew']}",
-                    fg=(200, 200, 200),
-                    bg=None
-                )
+                for line, text in enumerate(stats_text, 3):
+                    p(actions_x, stats_y + line, text, fg=_STATS_FG, bg=None)
         
         # Draw commands
-        commands_text = "Space: Select Action | Tab: Next Ship | T: Select Target | Esc: Retreat"
-        console.print(
-            console.width // 2,
-            console.height - 2,
-            commands_text,
-            fg=(150, 150, 150),
+        p(
+            layout.center_x,
+            layout.commands_y,
+            CombatState._COMMANDS_TEXT,
+            fg=_ACTION_FG,
             bg=None,
             alignment=tcod.CENTER
         )
@@ -349,246 +404,270 @@ class CombatState(State):
     def handle_event(self, evt):
         # Process input
         if isinstance(evt, event.KeyDown):
-            # Navigation
-            if evt.sym == event.K_UP:
-                self.camera_offset[1] -= 1
-                return True
-                
-            elif evt.sym == event.K_DOWN:
-                self.camera_offset[1] += 1
-                return True
-                
-            elif evt.sym == event.K_LEFT:
-                self.camera_offset[0] -= 1
-                return True
-                
-            elif evt.sym == event.K_RIGHT:
-                self.camera_offset[0] += 1
-                return True
-            
-            # Combat controls
-            if self.phase == "player":
-                # Next ship
-                if evt.sym == event.K_TAB:
-                    self._cycle_ship()
-                    return True
-                
-                # Select target
-                elif evt.sym == event.K_t:
-                    if self.enemy_ships:
-                        self.selected_target = (self.selected_target + 1) % len(self.enemy_ships)
-                    return True
-                
-                # Select/execute action
-                elif evt.sym == event.K_SPACE:
-                    if self.current_action:
-                        self._execute_action()
-                    else:
-                        self.current_action = "Move"  # Default action
-                    return True
-                
-                # Cycle through actions
-                elif evt.sym == event.K_a:
-                    self._cycle_action()
-                    return True
-            
-            # End turn
-            elif evt.sym == event.K_e:
-                if self.phase == "player":
-                    self._end_player_turn()
-                return True
-            
-            # Retreat/exit combat
-            elif evt.sym == event.K_ESCAPE:
-                self._attempt_retreat()
-                return True
+            handler = CombatState._KEY_HANDLERS.get(evt.sym)
+            if handler:
+                return handler(self)
                 
         return False
     
+    # Navigation
+    def _camera_up(self):
+        self.camera_offset[1] -= 1
+        return True
+    
+    def _camera_down(self):
+        self.camera_offset[1] += 1
+        return True
+    
+    def _camera_left(self):
+        self.camera_offset[0] -= 1
+        return True
+    
+    def _camera_right(self):
+        self.camera_offset[0] += 1
+        return True
+    
+    # Combat controls
+    def _next_ship_key(self):
+        if self.phase != "player":
+            return False
+        self._cycle_ship()
+        return True
+    
+    def _next_target_key(self):
+        if self.phase != "player":
+            return False
+        self._select_next_target()
+        return True
+    
+    def _select_action_key(self):
+        if self.phase != "player":
+            return False
+        if self.current_action_idx is not None:
+            self._execute_action()
+        else:
+            self.current_action_idx = 0  # Default action: Move
+        return True
+    
+    def _cycle_action_key(self):
+        if self.phase != "player":
+            return False
+        self._cycle_action()
+        return True
+    
+    def _end_turn_key(self):
+        if self.phase == "player":
+            self._end_player_turn()
+        return True
+    
+    def _retreat_key(self):
+        self._attempt_retreat()
+        return True
+    
     def _cycle_ship(self):
         """Cycle to the next player ship that hasn't acted."""
-        if not self.player_ships:
+        if not self.player_names:
             return
         
-        start_index = self.current_ship_index
-        while True:
-            self.current_ship_index = (self.current_ship_index + 1) % len(self.player_ships)
-            
-            # If we've checked all ships, break
-            if self.current_ship_index == start_index:
-                break
-                
-            # If this ship hasn't acted, select it
-            if not self.player_ships[self.current_ship_index]["has_acted"]:
-                break
+        num_ships = len(self.player_names)
+        full_mask = (1 << num_ships) - 1
+        available = ~self.acted_mask & full_mask
+        
+        if available:
+            # Rotate so bit 0 is the ship after the current one, then take
+            # the lowest set bit as the next ship that hasn't acted
+            shift = (self.current_ship_index + 1) % num_ships
+            rotated = ((available >> shift) | (available << (num_ships - shift))) & full_mask
+            offset = (rotated & -rotated).bit_length() - 1
+            self.current_ship_index = (shift + offset) % num_ships
         
         # Reset current action when switching ships
-        self.current_action = None
+        self.current_action_idx = None
     
     def _cycle_action(self):
         """Cycle through available actions."""
-        actions = [
-            "Move",
-            "Fire Cannons",
-            "Prepare to Board",
-            "Evasive Maneuvers",
-            "Intimidate",
-            "End Turn"
-        ]
-        
-        if self.current_action is None:
-            self.current_action = actions[0]
+        if self.current_action_idx is None:
+            self.current_action_idx = 0
         else:
-            current_index = actions.index(self.current_action)
-            self.current_action = actions[(current_index + 1) % len(actions)]
+            self.current_action_idx = (self.current_action_idx + 1) % CombatState._ACTION_COUNT
     
     def _execute_action(self):
         """Execute the currently selected action."""
-        if not self.player_ships or not self.current_action:
+        if not self.player_names or self.current_action_idx is None:
             return
         
-        ship = self.player_ships[self.current_ship_index]
+        idx = self.current_ship_index
         
-        if ship["has_acted"]:
-            self._add_to_log(f"{ship['name']} has already acted this turn.")
+        if self.acted_mask >> idx & 1:
+            self._add_to_log(f"{self.player_names[idx]} has already acted this turn.")
             return
         
-        # Handle different actions
-        if self.current_action == "Move":
-            self._add_to_log(f"{ship['name']} moves.")
-            ship["position"] = (ship["position"][0] + 2, ship["position"][1])
-            
-        elif self.current_action == "Fire Cannons":
-            if not self.enemy_ships:
-                self._add_to_log("No enemy ships to target!")
-                return
-                
-            target = self.enemy_ships[self.selected_target]
-            damage = random.randint(5, 20)
-            target["hull"] -= damage
-            
-            self._add_to_log(f"{ship['name']} fires cannons at {target['name']}!")
-            self._add_to_log(f"  Dealt {damage} damage to {target['name']}'s hull.")
-            
-            # Check if target is destroyed
-            if target["hull"] <= 0:
-                self._add_to_log(f"{target['name']} has been sunk!")
-                self.enemy_ships.pop(self.selected_target)
-                self.selected_target = min(self.selected_target, len(self.enemy_ships) - 1) if self.enemy_ships else 0
-                
-                # Check for victory
-                if not self.enemy_ships:
-                    self._combat_victory()
-                    return
-            
-        elif self.current_action == "Prepare to Board":
-            self._add_to_log(f"{ship['name']} prepares to board.")
-            
-        elif self.current_action == "Evasive Maneuvers":
-            self._add_to_log(f"{ship['name']} performs evasive maneuvers.")
-            
-        elif self.current_action == "Intimidate":
-            if not self.enemy_ships:
-                self._add_to_log("No enemy ships to intimidate!")
-                return
-                
-            target = self.enemy_ships[self.selected_target]
-            success = random.random() < 0.3  # 30% chance
-            
-            self._add_to_log(f"{ship['name']} attempts to intimidate {target['name']}!")
-            
-            if success:
-                self._add_to_log(f"  {target['name']} is intimidated and surrenders!")
-                self.enemy_ships.pop(self.selected_target)
-                self.selected_target = min(self.selected_target, len(self.enemy_ships) - 1) if self.enemy_ships else 0
-                
-                # Add to player fleet
-                self.game_state.player_fleet.append({
-                    "name": target["name"],
-                    "type": target["type"],
-                    "condition": "Damaged",
-                    "crew": target["crew"] // 2  # Reduced crew for captured ship
-                })
-                
-                # Check for victory
-                if not self.enemy_ships:
-                    self._combat_victory()
-                    return
-            else:
-                self._add_to_log(f"  {target['name']} stands firm!")
-            
-        elif self.current_action == "End Turn":
-            self._end_player_turn()
+        # Handlers return True when the ship has used its action
+        if not CombatState._ACTION_DISPATCH[self.current_action_idx](self, idx):
             return
         
         # Mark ship as having acted
-        ship["has_acted"] = True
+        self.acted_mask |= 1 << idx
         
         # Reset current action
-        self.current_action = None
+        self.current_action_idx = None
         
         # Move to next ship that hasn't acted
-        all_acted = True
-        for s in self.player_ships:
-            if not s["has_acted"]:
-                all_acted = False
-                break
-                
-        if all_acted:
+        if self.acted_mask == (1 << len(self.player_names)) - 1:
             self._end_player_turn()
         else:
             self._cycle_ship()
     
+    def _do_move(self, idx):
+        """Move the given player ship."""
+        self._add_to_log(f"{self.player_names[idx]} moves.")
+        self.player_pos[idx, 0] += 2
+        return True
+    
+    def _do_fire_cannons(self, idx):
+        """Fire the given player ship's cannons at the selected target."""
+        if not self.enemy_alive.any():
+            self._add_to_log("No enemy ships to target!")
+            return False
+            
+        ship_name = self.player_names[idx]
+        target_index = self.selected_target
+        target_name = self.enemy_names[target_index]
+        damage = random.randint(5, 20)
+        self.enemy_hull[target_index] -= damage
+        
+        self._add_to_log(f"{ship_name} fires cannons at {target_name}!")
+        self._add_to_log(f"  Dealt {damage} damage to {target_name}'s hull.")
+        
+        # Check if target is destroyed
+        if self.enemy_hull[target_index] <= 0:
+            self._add_to_log(f"{target_name} has been sunk!")
+            self.enemy_alive[target_index] = False
+            self._select_next_target()
+            
+            # Check for victory
+            if not self.enemy_alive.any():
+                self._combat_victory()
+                return False
+        
+        return True
+    
+    def _do_prepare_to_board(self, idx):
+        """Prepare the given player ship to board."""
+        self._add_to_log(f"{self.player_names[idx]} prepares to board.")
+        return True
+    
+    def _do_evasive_maneuvers(self, idx):
+        """Perform evasive maneuvers with the given player ship."""
+        self._add_to_log(f"{self.player_names[idx]} performs evasive maneuvers.")
+        return True
+    
+    def _do_intimidate(self, idx):
+        """Attempt to intimidate the selected target into surrendering."""
+        if not self.enemy_alive.any():
+            self._add_to_log("No enemy ships to intimidate!")
+            return False
+            
+        ship_name = self.player_names[idx]
+        target_index = self.selected_target
+        target_name = self.enemy_names[target_index]
+        success = random.random() < 0.3  # 30% chance
+        
+        self._add_to_log(f"{ship_name} attempts to intimidate {target_name}!")
+        
+        if success:
+            self._add_to_log(f"  {target_name} is intimidated and surrenders!")
+            
+            # Add to player fleet
+            self.game_state.player_fleet.append(
+                target_name,
+                self.enemy_types[target_index],
+                CONDITION_DAMAGED,
+                int(self.enemy_crew[target_index]) // 2  # Reduced crew for captured ship
+            )
+            
+            self.enemy_alive[target_index] = False
+            self._select_next_target()
+            
+            # Check for victory
+            if not self.enemy_alive.any():
+                self._combat_victory()
+                return False
+        else:
+            self._add_to_log(f"  {target_name} stands firm!")
+        
+        return True
+    
+    def _do_end_turn(self, idx):
+        """End the player's turn."""
+        self._end_player_turn()
+        return False
+    
     def _end_player_turn(self):
         """End the player's turn and start enemy turn."""
         self._add_to_log("Player turn ends. Enemy turn begins.")
         self.phase = "enemy"
         
         # Reset player ships acted status for next turn
-        for ship in self.player_ships:
-            ship["has_acted"] = False
+        self.acted_mask = 0
         
         # Process enemy turn (simplified)
         self._process_enemy_turn()
     
     def _process_enemy_turn(self):
-        """Process the enemy turn."""
-        if not self.enemy_ships or not self.player_ships:
+        """
+        Process the enemy turn.
+        
+        All enemies move and fire as a single simultaneous volley, so range
+        is measured against the lead player ship at the start of the turn
+        and sinkings are resolved once every shot has landed.
+        """
+        if not self.enemy_alive.any() or not self.player_alive.any():
             self._end_enemy_turn()
             return
-            
-        for enemy in self.enemy_ships:
-            # Simple AI: move toward player and attack
-            self._add_to_log(f"{enemy['name']} moves closer.")
-            enemy["position"] = (enemy["position"][0] - 1, enemy["position"][1])
-            
-            # Attack if in range
-            if enemy["position"][0] - self.player_ships[0]["position"][0] < 5:
-                target_index = random.randint(0, len(self.player_ships) - 1)
-                target = self.player_ships[target_index]
-                
-                damage = random.randint(5, 15)
-                target["hull"] -= damage
-                
-                self._add_to_log(f"{enemy['name']} fires at {target['name']}!")
-                self._add_to_log(f"  Dealt {damage} damage to {target['name']}'s hull.")
-                
-                # Check if target is destroyed
-                if target["hull"] <= 0:
-                    self._add_to_log(f"{target['name']} has been sunk!")
-                    self.player_ships.pop(target_index)
-                    self.current_ship_index = min(self.current_ship_index, len(self.player_ships) - 1) if self.player_ships else 0
-                    
-                    # Check for defeat
-                    if not self.player_ships:
-                        self._combat_defeat()
-                        return
+        
+        # Simple AI: move toward player and attack
+        enemies = np.flatnonzero(self.enemy_alive)
+        self.enemy_pos[enemies, 0] -= 1
+        
+        # Attack if in range of the lead player ship
+        alive_players = np.flatnonzero(self.player_alive)
+        in_range = (self.enemy_pos[enemies, 0] - self.player_pos[alive_players[0], 0]) < 5
+        num_attackers = int(np.count_nonzero(in_range))
+        
+        targets = alive_players[self._rng.integers(0, len(alive_players), size=num_attackers)]
+        damages = self._rng.integers(5, 16, size=num_attackers)
+        np.subtract.at(self.player_hull, targets, damages)
+        
+        # Log the volley in enemy order
+        shots = iter(zip(targets.tolist(), damages.tolist()))
+        for enemy_index, attacks in zip(enemies.tolist(), in_range.tolist()):
+            enemy_name = self.enemy_names[enemy_index]
+            self._add_to_log(f"{enemy_name} moves closer.")
+            if attacks:
+                target_index, damage = next(shots)
+                target_name = self.player_names[target_index]
+                self.player_stats_text[target_index] = None
+                self._add_to_log(f"{enemy_name} fires at {target_name}!")
+                self._add_to_log(f"  Dealt {damage} damage to {target_name}'s hull.")
+        
+        # Check for destroyed ships
+        sunk = self.player_alive & (self.player_hull <= 0)
+        for target_index in np.flatnonzero(sunk).tolist():
+            self._add_to_log(f"{self.player_names[target_index]} has been sunk!")
+        self.player_alive &= ~sunk
+        
+        # Check for defeat
+        if not self.player_alive.any():
+            self._combat_defeat()
+            return
         
         # End enemy turn
         self._end_enemy_turn()
     
     def _end_enemy_turn(self):
         """End the enemy turn and start a new player turn."""
+        self._compact_ships()
         self.turn += 1
         self.phase = "player"
         self._add_to_log(f"Turn {self.turn} begins. Player's turn.")
@@ -599,7 +678,7 @@ class CombatState(State):
         
         # Calculate rewards
         gold_reward = random.randint(50, 200)
-        self.game_state.player_resources["gold"] = self.game_state.player_resources.get("gold", 0) + gold_reward
+        self.game_state.player_resources.gold += gold_reward
         
         self._add_to_log(f"Gained {gold_reward} gold from the battle.")
         self._add_to_log("Press ESC to return to the world map.")
@@ -624,4 +703,29 @@ class CombatState(State):
     def _add_to_log(self, message):
         """Add a message to the combat log."""
         self.combat_log.append(message)
-        self.logger.debug(f"Combat log: {message}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Combat log: %s", message)
+    
+    # Key handlers, keyed by key symbol
+    _KEY_HANDLERS = {
+        event.K_UP: _camera_up,
+        event.K_DOWN: _camera_down,
+        event.K_LEFT: _camera_left,
+        event.K_RIGHT: _camera_right,
+        event.K_TAB: _next_ship_key,
+        event.K_t: _next_target_key,
+        event.K_SPACE: _select_action_key,
+        event.K_a: _cycle_action_key,
+        event.K_e: _end_turn_key,
+        event.K_ESCAPE: _retreat_key
+    }
+    
+    # Action handlers, indexed like _ACTIONS
+    _ACTION_DISPATCH = {
+        0: _do_move,
+        1: _do_fire_cannons,
+        2: _do_prepare_to_board,
+        3: _do_evasive_maneuvers,
+        4: _do_intimidate,
+        5: _do_end_turn
+    }
@@ -1,26 +1,33 @@
+from dataclasses import dataclass
 import tcod
 
-class Config:
+@dataclass(frozen=True)
+class _Config:
     """
     Configuration settings for RedRumRunner.
+    
+    Read-only; use the shared CONFIG instance.
     """
     # Display settings
-    SCREEN_WIDTH = 80
-    SCREEN_HEIGHT = 50
-    WINDOW_TITLE = "RedRumRunner"
+    SCREEN_WIDTH: int = 80
+    SCREEN_HEIGHT: int = 50
+    WINDOW_TITLE: str = "RedRumRunner"
     
     # Font settings
-    FONT_PATH = "assets/fonts/dejavu10x10_gs_tc.png"  # Adjust to your actual font path
-    FONT_FLAGS = tcod.FONT_TYPE_GREYSCALE | tcod.FONT_LAYOUT_TCOD
+    FONT_PATH: str = "assets/fonts/dejavu10x10_gs_tc.png"  # Adjust to your actual font path
+    FONT_FLAGS: int = tcod.FONT_TYPE_GREYSCALE | tcod.FONT_LAYOUT_TCOD
     
     # Game settings
-    GAME_VERSION = "0.1.0"
+    GAME_VERSION: str = "0.1.0"
     
     # Performance settings
-    FPS_LIMIT = 60
+    FPS_LIMIT: int = 60
+    EVENT_POLL_BUDGET: float = 0.002  # Seconds of event handling per frame; the rest waits a frame
     
     # Game balance settings
-    INITIAL_GOLD = 100
-    SHIP_COST_MULTIPLIER = 1.0
-    AUTHORITY_AWARENESS_INCREASE_RATE = 0.01
-    AUTHORITY_AWARENESS_DECREASE_RATE = 0.001
+    INITIAL_GOLD: int = 100
+    SHIP_COST_MULTIPLIER: float = 1.0
+    AUTHORITY_AWARENESS_INCREASE_RATE: float = 0.01
+    AUTHORITY_AWARENESS_DECREASE_RATE: float = 0.001
+
+CONFIG = _Config()
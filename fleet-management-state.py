@@ -1,16 +1,60 @@
 import tcod
 import tcod.event as event
+import types
 from src.states.state import State
+from src.engine.fleet import CONDITION_NAMES, CONDITION_GOOD
+from src.engine.resources import Resource
+
+# Divider glyph and color, written straight into the console arrays
+_H_LINE = ord("─")
+_LINE_FG = (100, 100, 100)
 
 class FleetManagementState(State):
     """
     Fleet management state - for managing ships and crews.
     """
+    _FOOTER_TEXT = "Tab: Switch Tab | Up/Down: Select Ship | W: World Map | Esc: Back"
+    _EMPTY_FLEET_KW = dict(fg=(150, 150, 150), bg=None, alignment=tcod.CENTER)
+    
+    # (selected, unselected) colors, indexed by condition id
+    _CONDITION_COLORS = (
+        ((100, 255, 100), (0, 200, 0)),    # Good
+        ((255, 255, 100), (200, 200, 0)),  # Damaged
+        ((255, 100, 100), (200, 0, 0)),    # Critical
+    )
+    
+    # Placeholder officers: (name, role, skill)
+    _OFFICERS = (
+        ("Jack Sparrow", "Captain", "Expert"),
+        ("William Turner", "First Mate", "Skilled"),
+        ("Joshamee Gibbs", "Quartermaster", "Experienced")
+    )
+    
+    # Placeholder repairs: (name, cost in gold, time in days, effect)
+    _REPAIRS = (
+        ("Hull Repairs", 50, 2, "+20% Hull Integrity"),
+        ("Sail Replacement", 30, 1, "+15% Speed"),
+        ("Cannon Maintenance", 40, 1, "+10% Firepower")
+    )
+    
+    # Cargo shown from player resources: (name, resource, unit, placeholder tons per unit)
+    _CARGO_ITEMS = (
+        ("Food", Resource.FOOD, "barrels", 2),
+        ("Water", Resource.WATER, "barrels", 3),
+        ("Rum", Resource.RUM, "casks", 1),
+        ("Ammunition", Resource.AMMUNITION, "crates", 2)
+    )
+    
     def __init__(self, game_state):
         super().__init__(game_state)
         self.selected_ship_index = 0
         self.selected_tab = "Ships"
         self.tabs = ["Ships", "Crew", "Cargo", "Repairs"]
+        self._tab_index = 0  # Index of selected_tab in tabs
+        self._layout_cache = None  # Static screen geometry and strings, built on first render
+        self._ship_text_cache = {}  # (tab, ship index) -> formatted ship text for that tab
+        self._dirty = True  # Whether the screen must be redrawn
+        self._frame = None  # Copy of the last drawn console contents
     
     def enter(self):
         super().enter()
@@ -20,6 +64,9 @@ class FleetManagementState(State):
             self.selected_ship_index = min(self.selected_ship_index, len(self.game_state.player_fleet) - 1)
         else:
             self.selected_ship_index = 0
+        # The fleet and resources may have changed while we were away
+        self._ship_text_cache.clear()
+        self._dirty = True
     
     def exit(self):
         super().exit()
@@ -30,12 +77,23 @@ class FleetManagementState(State):
         pass
     
     def render(self, console):
+        # Nothing on this screen changes between inputs, so restore the last
+        # frame (the game loop clears the console every frame)
+        frame = self._frame
+        if not self._dirty and frame is not None and frame.shape == console.rgb.shape:
+            console.rgb[...] = frame
+            return
+        
+        layout = self._layout_cache
+        if layout is None or layout.width != console.width or layout.height != console.height:
+            layout = self._build_layout(console)
+        
         # Clear console
         console.clear()
         
         # Draw header
         console.print(
-            console.width // 2,
+            layout.center_x,
             2,
             "Fleet Management",
             fg=(255, 255, 0),
@@ -45,7 +103,7 @@ class FleetManagementState(State):
         
         # Draw tabs
         for i, tab in enumerate(self.tabs):
-            x = console.width // len(self.tabs) * i + console.width // (len(self.tabs) * 2)
+            x = layout.tab_positions[i]
             y = 5
             fg = (255, 255, 255) if tab == self.selected_tab else (150, 150, 150)
             
@@ -70,153 +128,163 @@ class FleetManagementState(State):
         
         # Draw footer with available commands
         console.print(
-            console.width // 2,
-            console.height - 3,
-            "Tab: Switch Tab | Up/Down: Select Ship | W: World Map | Esc: Back",
+            layout.center_x,
+            layout.footer_y,
+            FleetManagementState._FOOTER_TEXT,
             fg=(150, 150, 150),
             bg=None,
             alignment=tcod.CENTER
         )
+        
+        self._frame = console.rgb.copy()
+        self._dirty = False
+    
+    def _build_layout(self, console):
+        """
+        Precompute the screen geometry and static strings for a console size.
+        
+        Args:
+            console (Console): tcod console being rendered to.
+            
+        Returns:
+            SimpleNamespace: The cached layout.
+        """
+        width = console.width
+        tab_width = width // len(self.tabs)
+        half_tab = width // (len(self.tabs) * 2)
+        
+        self._layout_cache = types.SimpleNamespace(
+            width=width,
+            height=console.height,
+            center_x=width // 2,
+            footer_y=console.height - 3,
+            tab_positions=[tab_width * i + half_tab for i in range(len(self.tabs))],
+            ships_divider_end=max(5, width - 5),
+            cargo_divider_end=max(10, width - 10),
+            box_width=max(2, width - 10)
+        )
+        return self._layout_cache
+    
+    @staticmethod
+    def _blit_hline(console, x0, x1, y, ch, fg):
+        """
+        Write a horizontal run of one glyph directly into the console arrays.
+        
+        Args:
+            console (Console): tcod console to render to.
+            x0 (int): First column.
+            x1 (int): Column after the last one.
+            y (int): Row.
+            ch (int): Glyph codepoint.
+            fg (tuple): Foreground color.
+        """
+        console.ch[y, x0:x1] = ch
+        console.fg[y, x0:x1] = fg
+    
+    @staticmethod
+    def _print_row(console, y, cells):
+        """
+        Print a row of text cells, as one string when the colors allow it.
+        
+        Args:
+            console (Console): tcod console to render to.
+            y (int): Row to print on.
+            cells (list): (x, text, fg, bg) tuples, sorted by x.
+        """
+        first_x, _, fg, bg = cells[0]
+        if any(cell[2] != fg or cell[3] != bg for cell in cells):
+            for x, text, cell_fg, cell_bg in cells:
+                console.print(x, y, text, fg=cell_fg, bg=cell_bg)
+            return
+        
+        # Pad (or cut) each cell to where the next one starts, as separate
+        # prints would overwrite any overflow
+        row = ""
+        for x, text, _, _ in cells:
+            offset = x - first_x
+            row = row[:offset].ljust(offset) + text
+        console.print(first_x, y, row, fg=fg, bg=bg)
+    
+    def _render_empty_fleet_message(self, console):
+        """Render the message shown by every tab when the fleet is empty."""
+        console.print(self._layout_cache.center_x, 15, "No ships in your fleet.", **self._EMPTY_FLEET_KW)
     
     def _render_ships_tab(self, console):
         """Render the ships tab content."""
         if not self.game_state.player_fleet:
-            console.print(
-                console.width // 2,
-                15,
-                "No ships in your fleet.",
-                fg=(150, 150, 150),
-                bg=None,
-                alignment=tcod.CENTER
-            )
+            self._render_empty_fleet_message(console)
             return
         
         # Draw ship list header
-        console.print(
-            10,
-            8,
-            "Ship Name",
-            fg=(200, 200, 200),
-            bg=None
-        )
-        
-        console.print(
-            30,
-            8,
-            "Type",
-            fg=(200, 200, 200),
-            bg=None
-        )
-        
-        console.print(
-            45,
-            8,
-            "Condition",
-            fg=(200, 200, 200),
-            bg=None
-        )
-        
-        console.print(
-            60,
-            8,
-            "Crew",
-            fg=(200, 200, 200),
-            bg=None
-        )
+        self._print_row(console, 8, [
+            (10, "Ship Name", (200, 200, 200), None),
+            (30, "Type", (200, 200, 200), None),
+            (45, "Condition", (200, 200, 200), None),
+            (60, "Crew", (200, 200, 200), None)
+        ])
         
         # Draw divider
-        for x in range(5, console.width - 5):
-            console.print(x, 9, "─", fg=(100, 100, 100))
+        self._blit_hline(console, 5, self._layout_cache.ships_divider_end, 9, _H_LINE, _LINE_FG)
         
         # Draw ships
-        for i, ship in enumerate(self.game_state.player_fleet):
+        fleet = self.game_state.player_fleet
+        ships = zip(fleet.names, fleet.types, fleet.conditions.tolist(), fleet.crew.tolist())
+        for i, (name, ship_type, condition, crew) in enumerate(ships):
             y = 10 + i * 2
+            selected = i == self.selected_ship_index
             
             # Highlight selected ship
-            fg = (255, 255, 255) if i == self.selected_ship_index else (150, 150, 150)
-            bg = (30, 30, 50) if i == self.selected_ship_index else None
+            fg = (255, 255, 255) if selected else (150, 150, 150)
+            bg = (30, 30, 50) if selected else None
             
+            # One padded row for the columns at x=10/30/45/60, then recolor
+            # the condition span
+            condition_name = CONDITION_NAMES[condition]
             console.print(
                 10,
                 y,
-                ship["name"],
-                fg=fg,
-                bg=bg
-            )
-            
-            console.print(
-                30,
-                y,
-                ship["type"],
-                fg=fg,
-                bg=bg
-            )
-            
-            # Color condition based on status
-            condition_color = fg
-            if ship["condition"] == "Good":
-                condition_color = (100, 255, 100) if i == self.selected_ship_index else (0, 200, 0)
-            elif ship["condition"] == "Damaged":
-                condition_color = (255, 255, 100) if i == self.selected_ship_index else (200, 200, 0)
-            elif ship["condition"] == "Critical":
-                condition_color = (255, 100, 100) if i == self.selected_ship_index else (200, 0, 0)
-                
-            console.print(
-                45,
-                y,
-                ship["condition"],
-                fg=condition_color,
-                bg=bg
-            )
-            
-            console.print(
-                60,
-                y,
-                str(ship["crew"]),
+                f"{name[:20]:<20}{ship_type[:15]:<15}{condition_name:<15}{crew}",
                 fg=fg,
                 bg=bg
             )
+            console.fg[y, 45:45 + len(condition_name)] = self._CONDITION_COLORS[condition][0 if selected else 1]
         
         # Draw selected ship details
-        if self.game_state.player_fleet:
-            ship = self.game_state.player_fleet[self.selected_ship_index]
+        if fleet:
+            index = self.selected_ship_index
+            layout = self._layout_cache
             
             # Draw box for ship details
             box_y = 20
             box_height = 10
             
-            # Draw top border
-            console.print(5, box_y, "┌" + "─" * (console.width - 12) + "┐", fg=(100, 100, 100))
-            
-            # Draw sides
-            for y in range(box_y + 1, box_y + box_height):
-                console.print(5, y, "│", fg=(100, 100, 100))
-                console.print(console.width - 6, y, "│", fg=(100, 100, 100))
+            console.draw_frame(5, box_y, layout.box_width, box_height + 1, fg=_LINE_FG, bg=None)
             
-            # Draw bottom border
-            console.print(5, box_y + box_height, "└" + "─" * (console.width - 12) + "┘", fg=(100, 100, 100))
+            key = ("Ships", index)
+            details = self._ship_text_cache.get(key)
+            if details is None:
+                details = self._ship_text_cache[key] = (
+                    f"Ship Details: {fleet.names[index]}",
+                    f"Type: {fleet.types[index]}",
+                    f"Condition: {fleet.condition_name(index)}",
+                    f"Crew: {fleet.crew[index]} sailors",
+                    "Hull Strength: 85%",  # Placeholder stats
+                    "Sail Condition: 90%",
+                    "Speed: Medium",
+                    "Firepower: Low"
+                )
             
             # Draw ship details
             console.print(
-                console.width // 2,
+                layout.center_x,
                 box_y + 1,
-                f"Ship Details: {ship['name']}",
+                details[0],
                 fg=(255, 255, 0),
                 bg=None,
                 alignment=tcod.CENTER
             )
             
-            details = [
-                f"Type: {ship['type']}",
-                f"Condition: {ship['condition']}",
-                f"Crew: {ship['crew']} sailors",
-                f"Hull Strength: 85%",  # Placeholder stats
-                f"Sail Condition: 90%",
-                f"Speed: Medium",
-                f"Firepower: Low"
-            ]
-            
-            for i, detail in enumerate(details):
+            for i, detail in enumerate(details[1:]):
                 console.print(
                     10,
                     box_y + 3 + i,
@@ -228,22 +296,23 @@ class FleetManagementState(State):
     def _render_crew_tab(self, console):
         """Render the crew tab content."""
         if not self.game_state.player_fleet:
-            console.print(
-                console.width // 2,
-                15,
-                "No ships in your fleet.",
-                fg=(150, 150, 150),
-                bg=None,
-                alignment=tcod.CENTER
-            )
+            self._render_empty_fleet_message(console)
             return
         
-        ship = self.game_state.player_fleet[self.selected_ship_index]
+        fleet = self.game_state.player_fleet
+        index = self.selected_ship_index
+        key = ("Crew", index)
+        text = self._ship_text_cache.get(key)
+        if text is None:
+            text = self._ship_text_cache[key] = (
+                f"Crew Management - {fleet.names[index]}",
+                f"Current Crew: {fleet.crew[index]} sailors"
+            )
         
         console.print(
             console.width // 2,
             10,
-            f"Crew Management - {ship['name']}",
+            text[0],
             fg=(200, 200, 200),
             bg=None,
             alignment=tcod.CENTER
@@ -252,7 +321,7 @@ class FleetManagementState(State):
         console.print(
             console.width // 2,
             12,
-            f"Current Crew: {ship['crew']} sailors",
+            text[1],
             fg=(255, 255, 255),
             bg=None,
             alignment=tcod.CENTER
@@ -286,19 +355,13 @@ class FleetManagementState(State):
             alignment=tcod.CENTER
         )
         
-        officers = [
-            {"name": "Jack Sparrow", "role": "Captain", "skill": "Expert"},
-            {"name": "William Turner", "role": "First Mate", "skill": "Skilled"},
-            {"name": "Joshamee Gibbs", "role": "Quartermaster", "skill": "Experienced"}
-        ]
-        
-        for i, officer in enumerate(officers):
+        for i, (name, role, skill) in enumerate(self._OFFICERS):
             y = 21 + i * 2
             
             console.print(
                 20,
                 y,
-                officer["name"],
+                name,
                 fg=(200, 200, 200),
                 bg=None
             )
@@ -306,7 +369,7 @@ class FleetManagementState(State):
             console.print(
                 40,
                 y,
-                officer["role"],
+                role,
                 fg=(200, 200, 150),
                 bg=None
             )
@@ -314,7 +377,7 @@ class FleetManagementState(State):
             console.print(
                 60,
                 y,
-                officer["skill"],
+                skill,
                 fg=(150, 200, 200),
                 bg=None
             )
@@ -322,22 +385,27 @@ class FleetManagementState(State):
     def _render_cargo_tab(self, console):
         """Render the cargo tab content."""
         if not self.game_state.player_fleet:
-            console.print(
-                console.width // 2,
-                15,
-                "No ships in your fleet.",
-                fg=(150, 150, 150),
-                bg=None,
-                alignment=tcod.CENTER
-            )
+            self._render_empty_fleet_message(console)
             return
         
-        ship = self.game_state.player_fleet[self.selected_ship_index]
+        key = ("Cargo", self.selected_ship_index)
+        text = self._ship_text_cache.get(key)
+        if text is None:
+            # Cargo is shown from player resources as a placeholder
+            amounts = self.game_state.player_resources.amounts.tolist()
+            rows = []
+            for name, resource, unit, weight_per_unit in self._CARGO_ITEMS:
+                amount = amounts[resource]
+                rows.append((name, f"{amount} {unit}", f"{weight_per_unit * amount} tons"))
+            text = self._ship_text_cache[key] = (
+                f"Cargo - {self.game_state.player_fleet.names[self.selected_ship_index]}",
+                tuple(rows)
+            )
         
         console.print(
             console.width // 2,
             10,
-            f"Cargo - {ship['name']}",
+            text[0],
             fg=(200, 200, 200),
             bg=None,
             alignment=tcod.CENTER
@@ -361,49 +429,23 @@ class FleetManagementState(State):
             alignment=tcod.CENTER
         )
         
-        # Draw cargo list (using player resources as placeholder)
-        cargo_items = [
-            {"name": "Food", "amount": self.game_state.player_resources.get("food", 0), "unit": "barrels"},
-            {"name": "Water", "amount": self.game_state.player_resources.get("water", 0), "unit": "barrels"},
-            {"name": "Rum", "amount": self.game_state.player_resources.get("rum", 0), "unit": "casks"},
-            {"name": "Ammunition", "amount": self.game_state.player_resources.get("ammunition", 0), "unit": "crates"}
-        ]
-        
-        console.print(
-            15,
-            18,
-            "Cargo Item",
-            fg=(200, 200, 200),
-            bg=None
-        )
-        
-        console.print(
-            40,
-            18,
-            "Amount",
-            fg=(200, 200, 200),
-            bg=None
-        )
-        
-        console.print(
-            55,
-            18,
-            "Weight",
-            fg=(200, 200, 200),
-            bg=None
-        )
+        self._print_row(console, 18, [
+            (15, "Cargo Item", (200, 200, 200), None),
+            (40, "Amount", (200, 200, 200), None),
+            (55, "Weight", (200, 200, 200), None)
+        ])
         
         # Draw divider
-        for x in range(10, console.width - 10):
-            console.print(x, 19, "─", fg=(100, 100, 100))
+        self._blit_hline(console, 10, self._layout_cache.cargo_divider_end, 19, _H_LINE, _LINE_FG)
         
-        for i, item in enumerate(cargo_items):
+        # Draw cargo list
+        for i, (name, amount_text, weight_text) in enumerate(text[1]):
             y = 21 + i * 2
             
             console.print(
                 15,
                 y,
-                item["name"],
+                name,
                 fg=(200, 200, 200),
                 bg=None
             )
@@ -411,19 +453,15 @@ class FleetManagementState(State):
             console.print(
                 40,
                 y,
-                f"{item['amount']} {item['unit']}",
+                amount_text,
                 fg=(200, 200, 150),
                 bg=None
             )
             
-            # Placeholder weights
-            weights = {"Food": 2, "Water": 3, "Rum": 1, "Ammunition": 2}
-            weight = weights.get(item["name"], 1) * item["amount"]
-            
             console.print(
                 55,
                 y,
-                f"{weight} tons",
+                weight_text,
                 fg=(150, 200, 200),
                 bg=None
             )
@@ -431,29 +469,34 @@ class FleetManagementState(State):
     def _render_repairs_tab(self, console):
         """Render the repairs tab content."""
         if not self.game_state.player_fleet:
-            console.print(
-                console.width // 2,
-                15,
-                "No ships in your fleet.",
-                fg=(150, 150, 150),
-                bg=None,
-                alignment=tcod.CENTER
-            )
+            self._render_empty_fleet_message(console)
             return
         
-        ship = self.game_state.player_fleet[self.selected_ship_index]
+        fleet = self.game_state.player_fleet
+        index = self.selected_ship_index
+        key = ("Repairs", index)
+        text = self._ship_text_cache.get(key)
+        if text is None:
+            text = self._ship_text_cache[key] = (
+                f"Repairs - {fleet.names[index]}",
+                f"Ship Condition: {fleet.condition_name(index)}",
+                tuple(
+                    (name, f"Cost: {cost} gold | Time: {time} days | Effect: {effect}")
+                    for name, cost, time, effect in self._REPAIRS
+                )
+            )
         
         console.print(
             console.width // 2,
             10,
-            f"Repairs - {ship['name']}",
+            text[0],
             fg=(200, 200, 200),
             bg=None,
             alignment=tcod.CENTER
         )
         
         # Condition affects available repairs
-        if ship["condition"] == "Good":
+        if fleet.conditions[index] == CONDITION_GOOD:
             console.print(
                 console.width // 2,
                 15,
@@ -466,25 +509,19 @@ class FleetManagementState(State):
             console.print(
                 console.width // 2,
                 15,
-                f"Ship Condition: {ship['condition']}",
+                text[1],
                 fg=(255, 200, 100),
                 bg=None,
                 alignment=tcod.CENTER
             )
             
-            repairs = [
-                {"name": "Hull Repairs", "cost": 50, "time": 2, "effect": "+20% Hull Integrity"},
-                {"name": "Sail Replacement", "cost": 30, "time": 1, "effect": "+15% Speed"},
-                {"name": "Cannon Maintenance", "cost": 40, "time": 1, "effect": "+10% Firepower"}
-            ]
-            
-            for i, repair in enumerate(repairs):
+            for i, (name, repair_text) in enumerate(text[2]):
                 y = 18 + i * 3
                 
                 console.print(
                     20,
                     y,
-                    repair["name"],
+                    name,
                     fg=(255, 255, 255),
                     bg=None
                 )
@@ -492,7 +529,7 @@ class FleetManagementState(State):
                 console.print(
                     20,
                     y + 1,
-                    f"Cost: {repair['cost']} gold | Time: {repair['time']} days | Effect: {repair['effect']}",
+                    repair_text,
                     fg=(150, 150, 150),
                     bg=None
                 )
@@ -502,20 +539,19 @@ class FleetManagementState(State):
         if isinstance(evt, event.KeyDown):
             # Tab switching
             if evt.sym == event.K_TAB:
-                current_index = self.tabs.index(self.selected_tab)
-                next_index = (current_index + 1) % len(self.tabs)
-                self.selected_tab = self.tabs[next_index]
+                self._tab_index = (self._tab_index + 1) % len(self.tabs)
+                self.selected_tab = self.tabs[self._tab_index]
+                self._dirty = True
                 return True
             
-            # Ship selection
-            elif evt.sym == event.K_UP:
-                if self.game_state.player_fleet:
-                    self.selected_ship_index = (self.selected_ship_index - 1) % len(self.game_state.player_fleet)
-                return True
-                
-            elif evt.sym == event.K_DOWN:
-                if self.game_state.player_fleet:
-                    self.selected_ship_index = (self.selected_ship_index + 1) % len(self.game_state.player_fleet)
+            # Ship selection (stops at either end of the list)
+            elif evt.sym == event.K_UP or evt.sym == event.K_DOWN:
+                delta = -1 if evt.sym == event.K_UP else 1
+                n = len(self.game_state.player_fleet)
+                index = max(0, min(self.selected_ship_index + delta, n - 1))
+                if index != self.selected_ship_index:
+                    self.selected_ship_index = index
+                    self._dirty = True
                 return True
             
             # Return to world map
@@ -0,0 +1,90 @@
+import numpy as np
+
+# Ship conditions, indexed by condition id
+CONDITION_NAMES = ("Good", "Damaged", "Critical")
+CONDITION_GOOD = 0
+CONDITION_DAMAGED = 1
+CONDITION_CRITICAL = 2
+
+class Fleet:
+    """
+    A fleet of ships, stored as parallel per-ship arrays.
+    
+    Names and types are plain lists; conditions (ids into CONDITION_NAMES)
+    and crew counts are NumPy arrays. Use append() to add ships rather than
+    touching the arrays directly.
+    """
+    def __init__(self):
+        self.names = []
+        self.types = []
+        self.conditions = np.zeros(0, dtype=np.int8)
+        self.crew = np.zeros(0, dtype=np.int32)
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def append(self, name, ship_type, condition, crew):
+        """
+        Add a ship to the fleet.
+        
+        The condition and crew arrays are reallocated on every call, so
+        adding a ship costs O(N). That is fine for fleets of a few dozen
+        ships; build large fleets with from_dict instead.
+        
+        Args:
+            name (str): Ship name.
+            ship_type (str): Ship type, e.g. "Sloop".
+            condition (int or str): Condition id or name.
+            crew (int): Number of crew aboard.
+        """
+        if isinstance(condition, str):
+            condition = CONDITION_NAMES.index(condition)
+        
+        self.names.append(name)
+        self.types.append(ship_type)
+        self.conditions = np.append(self.conditions, np.int8(condition))
+        self.crew = np.append(self.crew, np.int32(crew))
+    
+    def condition_name(self, index):
+        """
+        Get the condition name of a ship.
+        
+        Args:
+            index (int): Ship index.
+        
+        Returns:
+            str: "Good", "Damaged" or "Critical".
+        """
+        return CONDITION_NAMES[self.conditions[index]]
+    
+    def to_dict(self):
+        """
+        Convert to a dictionary for serialization.
+        
+        Returns:
+            dict: Dictionary of per-ship columns as plain lists.
+        """
+        return {
+            "names": list(self.names),
+            "types": list(self.types),
+            "conditions": self.conditions.tolist(),
+            "crew": self.crew.tolist()
+        }
+    
+    @staticmethod
+    def from_dict(data):
+        """
+        Create a Fleet from a dictionary.
+        
+        Args:
+            data (dict): Dictionary representation.
+        
+        Returns:
+            Fleet: New Fleet instance.
+        """
+        fleet = Fleet()
+        fleet.names = list(data.get("names", []))
+        fleet.types = list(data.get("types", []))
+        fleet.conditions = np.array(data.get("conditions", []), dtype=np.int8)
+        fleet.crew = np.array(data.get("crew", []), dtype=np.int32)
+        return fleet
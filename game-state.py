@@ -1,12 +1,14 @@
-import json
-import pickle
+import io
 import logging
-from datetime import datetime
-import os
 
-# This will be imported once implemented
-# from src.engine.hex_grid import HexGrid
-# from src.engine.calendar import Calendar
+import numpy as np
+
+from src.engine.fleet import Fleet, CONDITION_GOOD
+from src.engine.resources import Resources
+from src.engine.hex_grid import HexGrid
+from src.engine.calendar import Calendar
+
+_LOG = logging.getLogger(__name__)
 
 class GameState:
     """
@@ -14,17 +16,18 @@ class GameState:
     """
     def __init__(self):
         self.world_grid = None  # HexGrid instance for the world
-        self.player_fleet = []  # List of ships in the player's fleet
-        self.player_resources = {}  # Dictionary of player resources
+        self.player_fleet = Fleet()  # Ships in the player's fleet
+        self.player_resources = Resources()  # Player resource amounts
         self.calendar = None  # Game time tracking (will be Calendar instance)
         self.authority_awareness = 0.0  # Authority awareness level (0.0 - 1.0)
-        self.discovered_locations = set()  # Set of discovered location coordinates
+        self._discovered_packed = set()  # Packed keys of discovered location coordinates
+        self._discovered_coords = []  # Discovered (q, r) coordinates in discovery order
         self.quests = []  # List of active quests
         self.game_version = "0.1.0"  # Version for save compatibility
         self.seed = None  # World generation seed
         
         # Setup logging
-        self.logger = logging.getLogger(__name__)
+        self.logger = _LOG
         
     def create_new_game(self, seed=None):
         """
@@ -40,18 +43,11 @@ class GameState:
         # self.world_grid = HexGrid()
         
         # Initialize player resources
-        self.player_resources = {
-            "gold": 100,
-            "food": 50,
-            "water": 50,
-            "rum": 10,
-            "ammunition": 20
-        }
+        self.player_resources = Resources(gold=100, food=50, water=50, rum=10, ammunition=20)
         
         # Create a test fleet for development
-        self.player_fleet = [
-            {"name": "The Dreadnought", "type": "Sloop", "condition": "Good", "crew": 15},
-        ]
+        self.player_fleet = Fleet()
+        self.player_fleet.append("The Dreadnought", "Sloop", CONDITION_GOOD, 15)
         
         # Reset calendar (will implement Calendar class later)
         # self.calendar = Calendar()
@@ -71,6 +67,37 @@ class GameState:
         """
         # Update any time-based events, NPCs, etc.
         pass
+    
+    @staticmethod
+    def _pack_location(q, r):
+        """Pack a (q, r) coordinate into a single 64-bit key."""
+        return (q & 0xFFFFFFFF) << 32 | (r & 0xFFFFFFFF)
+    
+    def add_location(self, q, r):
+        """
+        Mark a location as discovered.
+        
+        Args:
+            q (int): Location q coordinate.
+            r (int): Location r coordinate.
+        """
+        key = self._pack_location(q, r)
+        if key not in self._discovered_packed:
+            self._discovered_packed.add(key)
+            self._discovered_coords.append((q, r))
+    
+    def has_location(self, q, r):
+        """
+        Check whether a location has been discovered.
+        
+        Args:
+            q (int): Location q coordinate.
+            r (int): Location r coordinate.
+            
+        Returns:
+            bool: True if the location is discovered.
+        """
+        return self._pack_location(q, r) in self._discovered_packed
         
     def validate(self):
         """
@@ -95,28 +122,32 @@ class GameState:
             
         return is_valid
         
-    def save_game(self, filename):
+    def save_game(self, filename, backup=False):
         """
         Save the game state to a file.
         
+        The file is written to a temporary path and then atomically swapped
+        in, so an interrupted save never leaves a truncated save behind.
+        
         Args:
             filename (str): Name of the save file.
+            backup (bool): Keep the previous save as a .bak file.
             
         Returns:
             bool: True if save was successful, False otherwise.
         """
+        import os
+        import shutil
+        from datetime import datetime
+        import msgpack
+        
         save_dir = os.path.join(os.getcwd(), 'saves')
         os.makedirs(save_dir, exist_ok=True)
         save_path = os.path.join(save_dir, f"{filename}.save")
         
+        temp_path = f"{save_path}.tmp"
+        
         try:
-            # Create a backup if file exists
-            if os.path.exists(save_path):
-                backup_path = f"{save_path}.bak"
-                if os.path.exists(backup_path):
-                    os.remove(backup_path)
-                os.rename(save_path, backup_path)
-            
             # Add save metadata
             save_data = {
                 "timestamp": datetime.now().isoformat(),
@@ -124,14 +155,24 @@ class GameState:
                 "seed": self.seed
             }
             
-            with open(save_path, 'wb') as f:
-                pickle.dump((save_data, self), f)
+            with open(temp_path, 'wb') as f:
+                f.write(msgpack.packb({"meta": save_data, "state": self.to_dict()}, use_bin_type=True))
+                f.flush()
+                os.fsync(f.fileno())
+            
+            # Keep a copy of the previous save only when asked to; the save
+            # itself stays in place until the new one atomically replaces it
+            if backup and os.path.exists(save_path):
+                shutil.copy2(save_path, f"{save_path}.bak")
+            os.replace(temp_path, save_path)
                 
             self.logger.info(f"Game saved to {save_path}")
             return True
             
         except Exception as e:
             self.logger.error(f"Error saving game: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             return False
     
     @staticmethod
@@ -145,46 +186,151 @@ class GameState:
         Returns:
             GameState: Loaded game state or None if load failed.
         """
-        logger = logging.getLogger(__name__)
+        import os
+        
         save_dir = os.path.join(os.getcwd(), 'saves')
         save_path = os.path.join(save_dir, f"{filename}.save")
         
         if not os.path.exists(save_path):
-            logger.error(f"Save file {save_path} does not exist")
+            _LOG.error(f"Save file {save_path} does not exist")
             return None
             
         try:
-            with open(save_path, 'rb') as f:
-                save_data, game_state = pickle.load(f)
+            save_data, game_state = GameState._read_save(save_path)
                 
-            logger.info(f"Game loaded from {save_path}, version {save_data['game_version']}")
+            _LOG.info(f"Game loaded from {save_path}, version {save_data['game_version']}")
             
             # Perform version compatibility check if needed
             current_version = "0.1.0"
             if save_data["game_version"] != current_version:
-                logger.warning(f"Save version mismatch: {save_data['game_version']} vs {current_version}")
+                _LOG.warning(f"Save version mismatch: {save_data['game_version']} vs {current_version}")
                 
             if not game_state.validate():
-                logger.warning("Loaded game state validation failed")
+                _LOG.warning("Loaded game state validation failed")
                 
             return game_state
             
         except Exception as e:
-            logger.error(f"Error loading game: {e}")
+            _LOG.error(f"Error loading game: {e}")
             
             # Try to load backup if it exists
             backup_path = f"{save_path}.bak"
             if os.path.exists(backup_path):
-                logger.info("Attempting to load backup save")
+                _LOG.info("Attempting to load backup save")
                 try:
-                    with open(backup_path, 'rb') as f:
-                        save_data, game_state = pickle.load(f)
+                    save_data, game_state = GameState._read_save(backup_path)
                     return game_state
                 except Exception as backup_e:
-                    logger.error(f"Error loading backup: {backup_e}")
+                    _LOG.error(f"Error loading backup: {backup_e}")
                     
             return None
     
+    @staticmethod
+    def _read_save(path):
+        """
+        Read a save file written by save_game.
+        
+        Args:
+            path (str): Path to the save file.
+            
+        Returns:
+            tuple: (save metadata dict, GameState).
+        """
+        import msgpack
+        
+        with open(path, 'rb') as f:
+            data = msgpack.unpackb(f.read(), raw=False)
+        return data["meta"], GameState.from_dict(data["state"])
+    
+    def to_dict(self):
+        """
+        Convert game state to a dictionary of plain data for serialization.
+        
+        Returns:
+            dict: Dictionary representation.
+        """
+        return self._build_dict(for_json=False)
+    
+    def _build_dict(self, for_json):
+        """
+        Build the dictionary form used by to_dict and to_json.
+        
+        Args:
+            for_json (bool): Store discovered locations and the world grid as
+                JSON-friendly lists and dicts instead of packed bytes.
+            
+        Returns:
+            dict: Dictionary representation.
+        """
+        if for_json:
+            locations = [list(coord) for coord in self._discovered_coords]
+        else:
+            locations = np.asarray(self._discovered_coords, dtype=np.int32).tobytes()
+        
+        state_dict = {
+            "game_version": self.game_version,
+            "seed": self.seed,
+            "player_fleet": self.player_fleet.to_dict(),
+            "player_resources": self.player_resources.to_dict(),
+            "authority_awareness": self.authority_awareness,
+            "discovered_locations": locations,
+            "quests": self.quests
+        }
+        
+        if self.world_grid is not None:
+            if for_json:
+                state_dict["world_grid"] = self.world_grid.to_dict()
+            else:
+                # The grid is stored as NPZ bytes rather than one dict per cell
+                buffer = io.BytesIO()
+                self.world_grid.to_npz(buffer)
+                state_dict["world_grid"] = buffer.getvalue()
+            
+        if self.calendar is not None:
+            state_dict["calendar"] = self.calendar.to_dict()
+            
+        return state_dict
+    
+    @staticmethod
+    def from_dict(state_dict):
+        """
+        Create a game state from a dictionary produced by to_dict.
+        
+        Args:
+            state_dict (dict): Dictionary representation.
+            
+        Returns:
+            GameState: New game state.
+        """
+        game_state = GameState()
+        game_state.game_version = state_dict.get("game_version", "0.1.0")
+        game_state.seed = state_dict.get("seed")
+        game_state.player_fleet = Fleet.from_dict(state_dict.get("player_fleet", {}))
+        game_state.player_resources = Resources.from_dict(state_dict.get("player_resources", {}))
+        game_state.authority_awareness = state_dict.get("authority_awareness", 0.0)
+        
+        # Saves hold packed int32 (q, r) pairs; JSON holds a list of pairs
+        locations = state_dict.get("discovered_locations", [])
+        if isinstance(locations, bytes):
+            locations = np.frombuffer(locations, dtype=np.int32)
+        for q, r in np.asarray(locations, dtype=np.int32).reshape(-1, 2).tolist():
+            game_state.add_location(q, r)
+            
+        game_state.quests = state_dict.get("quests", [])
+        
+        # Saves hold NPZ bytes; JSON holds the grid's dict form
+        if "world_grid" in state_dict:
+            grid_data = state_dict["world_grid"]
+            if isinstance(grid_data, bytes):
+                game_state.world_grid = HexGrid.from_npz(io.BytesIO(grid_data))
+            else:
+                game_state.world_grid = HexGrid.from_dict(grid_data)
+            
+        if "calendar" in state_dict:
+            game_state.calendar = Calendar.from_dict(state_dict["calendar"])
+            
+        return game_state
+    
     def to_json(self):
         """
         Convert game state to JSON for easier debugging or modding.
@@ -192,25 +338,10 @@ class GameState:
         Returns:
             str: JSON representation of the game state.
         """
+        import json
+        
         try:
-            # Create a dictionary of serializable data
-            state_dict = {
-                "game_version": self.game_version,
-                "seed": self.seed,
-                "player_resources": self.player_resources,
-                "authority_awareness": self.authority_awareness,
-                "discovered_locations": list(self.discovered_locations),
-                # Add other serializable properties
-            }
-            
-            # Convert calendar to dict
-            if self.calendar:
-                state_dict["calendar"] = self.calendar.to_dict()
-                
-            # Complex objects require custom serialization
-            # For example, world grid would need a to_dict method
-            
-            return json.dumps(state_dict, indent=2)
+            return json.dumps(self._build_dict(for_json=True), indent=2)
             
         except Exception as e:
             self.logger.error(f"Error converting game state to JSON: {e}")
@@ -227,25 +358,11 @@ class GameState:
         Returns:
             GameState: Game state from JSON or None if conversion failed.
         """
-        logger = logging.getLogger(__name__)
+        import json
+        
         try:
-            state_dict = json.loads(json_str)
-            
-            game_state = GameState()
-            game_state.game_version = state_dict.get("game_version", "0.1.0")
-            game_state.seed = state_dict.get("seed")
-            game_state.player_resources = state_dict.get("player_resources", {})
-            game_state.authority_awareness = state_dict.get("authority_awareness", 0.0)
-            game_state.discovered_locations = set(state_dict.get("discovered_locations", []))
-            
-            # Recreate calendar
-            if "calendar" in state_dict:
-                game_state.calendar = Calendar.from_dict(state_dict["calendar"])
-                
-            # Complex objects require custom deserialization
-                
-            return game_state
+            return GameState.from_dict(json.loads(json_str))
             
         except Exception as e:
-            logger.error(f"Error creating game state from JSON: {e}")
+            _LOG.error(f"Error creating game state from JSON: {e}")
             return None
@@ -5,10 +5,11 @@ Based on the excellent reference at https://www.redblobgames.com/grids/hexagons/
 """
 import math
 import json
+import heapq
 import numpy as np
 from enum import Enum
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Set, Optional, Any, Generator
+from typing import Dict, List, Tuple, Set, Optional, Any, Generator, Union, BinaryIO
 
 
 class HexOrientation(Enum):
@@ -44,12 +45,38 @@ FLAT_TOP = LayoutConstants(
     start_angle=0.0
 )
 
+# Unit (cos, sin) offsets of the six hex corners for each orientation
+_CORNER_UNITS = {
+    orientation: tuple(
+        (math.cos(angle), math.sin(angle))
+        for angle in (2.0 * math.pi * (M.start_angle + corner) / 6.0 for corner in range(6))
+    )
+    for orientation, M in ((HexOrientation.POINTY_TOP, POINTY_TOP), (HexOrientation.FLAT_TOP, FLAT_TOP))
+}
+_CORNER_UNIT_ARRAYS = {orientation: np.array(units) for orientation, units in _CORNER_UNITS.items()}
+
+# Forward (hex -> pixel) and backward (pixel -> hex) 2x2 matrices
+_FORWARD_MATRICES = {
+    HexOrientation.POINTY_TOP: np.array([[POINTY_TOP.f0, POINTY_TOP.f1], [POINTY_TOP.f2, POINTY_TOP.f3]]),
+    HexOrientation.FLAT_TOP: np.array([[FLAT_TOP.f0, FLAT_TOP.f1], [FLAT_TOP.f2, FLAT_TOP.f3]])
+}
+_BACKWARD_MATRICES = {
+    HexOrientation.POINTY_TOP: np.array([[POINTY_TOP.b0, POINTY_TOP.b1], [POINTY_TOP.b2, POINTY_TOP.b3]]),
+    HexOrientation.FLAT_TOP: np.array([[FLAT_TOP.b0, FLAT_TOP.b1], [FLAT_TOP.b2, FLAT_TOP.b3]])
+}
+
+
+def _pack_xz(x: int, z: int) -> int:
+    """Pack a hex's x and z (y is implied) into one int key for set lookups."""
+    return (x << 32) | (z & 0xFFFFFFFF)
+
 
 class HexCoord:
     """
     Represents a hex grid coordinate using cube coordinates (x, y, z).
     Provides methods for coordinate conversions, distance calculations, and more.
     """
+    __slots__ = ('x', 'y', 'z')
     
     def __init__(self, x: int, y: int, z: int = None):
         """
@@ -73,6 +100,28 @@ class HexCoord:
             if abs(x + y + z) > 0.0001:
                 raise ValueError(f"Invalid cube coordinates: {x}, {y}, {z}. Must satisfy x + y + z = 0")
     
+    @classmethod
+    def raw(cls, x: int, y: int, z: int) -> 'HexCoord':
+        """
+        Create a HexCoord without validating x + y + z = 0.
+        
+        For internal paths whose coordinates are valid by construction;
+        external callers should use the validating constructor.
+        
+        Args:
+            x: The x-coordinate
+            y: The y-coordinate
+            z: The z-coordinate
+            
+        Returns:
+            A new HexCoord object
+        """
+        coord = cls.__new__(cls)
+        coord.x = x
+        coord.y = y
+        coord.z = z
+        return coord
+    
     def __eq__(self, other):
         """Check if two HexCoord objects are equal."""
         if not isinstance(other, HexCoord):
@@ -89,15 +138,15 @@ class HexCoord:
     
     def __add__(self, other):
         """Add two hex coordinates."""
-        return HexCoord(self.x + other.x, self.y + other.y, self.z + other.z)
+        return HexCoord.raw(self.x + other.x, self.y + other.y, self.z + other.z)
     
     def __sub__(self, other):
         """Subtract one hex coordinate from another."""
-        return HexCoord(self.x - other.x, self.y - other.y, self.z - other.z)
+        return HexCoord.raw(self.x - other.x, self.y - other.y, self.z - other.z)
     
     def __mul__(self, scalar):
         """Multiply a hex coordinate by a scalar."""
-        return HexCoord(self.x * scalar, self.y * scalar, self.z * scalar)
+        return HexCoord.raw(self.x * scalar, self.y * scalar, self.z * scalar)
     
     # Coordinate conversions
     
@@ -116,7 +165,7 @@ class HexCoord:
         x = q
         z = r
         y = -x - z
-        return cls(x, y, z)
+        return cls.raw(x, y, z)
     
     @classmethod
     def from_offset(cls, col: int, row: int, orientation: HexOrientation = HexOrientation.POINTY_TOP) -> 'HexCoord':
@@ -131,18 +180,43 @@ class HexCoord:
         Returns:
             A new HexCoord object
         """
+        # (n - (n & 1)) // 2 is n >> 1 for any int, negatives included
         if orientation == HexOrientation.POINTY_TOP:
             # Odd-r offset
-            x = col - (row - (row & 1)) // 2
+            x = col - (row >> 1)
             z = row
-            y = -x - z
         else:  # FLAT_TOP
             # Odd-q offset
             x = col
-            z = row - (col - (col & 1)) // 2
-            y = -x - z
+            z = row - (col >> 1)
         
-        return cls(x, y, z)
+        return cls.raw(x, -x - z, z)
+    
+    @staticmethod
+    def from_offset_array(cols: np.ndarray, rows: np.ndarray,
+                          orientation: HexOrientation = HexOrientation.POINTY_TOP) -> np.ndarray:
+        """
+        Convert arrays of offset coordinates to cube coordinates.
+        
+        Args:
+            cols: Integer array of columns in the offset system
+            rows: Integer array of rows in the offset system
+            orientation: The orientation of the hex grid (POINTY_TOP or FLAT_TOP)
+            
+        Returns:
+            An (N, 3) int32 array of (x, y, z) rows, as from_offset would give
+        """
+        cols = np.asarray(cols, dtype=np.int32).ravel()
+        rows = np.asarray(rows, dtype=np.int32).ravel()
+        
+        if orientation == HexOrientation.POINTY_TOP:
+            xs = cols - (rows >> 1)
+            zs = rows
+        else:  # FLAT_TOP
+            xs = cols
+            zs = rows - (cols >> 1)
+        
+        return np.stack((xs, -xs - zs, zs), axis=1)
     
     def to_axial(self) -> Tuple[int, int]:
         """
@@ -165,12 +239,12 @@ class HexCoord:
         """
         if orientation == HexOrientation.POINTY_TOP:
             # Odd-r offset
-            col = self.x + (self.z - (self.z & 1)) // 2
+            col = self.x + (self.z >> 1)
             row = self.z
         else:  # FLAT_TOP
             # Odd-q offset
             col = self.x
-            row = self.z + (self.x - (self.x & 1)) // 2
+            row = self.z + (self.x >> 1)
         
         return (col, row)
     
@@ -186,7 +260,21 @@ class HexCoord:
         Returns:
             The distance in hex steps
         """
-        return (abs(self.x - other.x) + abs(self.y - other.y) + abs(self.z - other.z)) // 2
+        # The sum is always even for valid cube coordinates, so >> 1 is exact
+        return (abs(self.x - other.x) + abs(self.y - other.y) + abs(self.z - other.z)) >> 1
+    
+    def distances(self, coords: np.ndarray) -> np.ndarray:
+        """
+        Calculate the distance from this hex to many hexes at once.
+        
+        Args:
+            coords: An (N, 3) integer array of (x, y, z) cube coordinates
+            
+        Returns:
+            An (N,) integer array of distances in hex steps
+        """
+        deltas = np.abs(np.asarray(coords) - (self.x, self.y, self.z))
+        return deltas.sum(axis=1) >> 1
     
     def get_neighbors(self) -> List['HexCoord']:
         """
@@ -195,13 +283,7 @@ class HexCoord:
         Returns:
             A list of the six adjacent HexCoord objects
         """
-        # Directions in cube coordinates: (x, y, z)
-        directions = [
-            HexCoord(1, -1, 0), HexCoord(1, 0, -1), HexCoord(0, 1, -1),
-            HexCoord(-1, 1, 0), HexCoord(-1, 0, 1), HexCoord(0, -1, 1)
-        ]
-        
-        return [self + direction for direction in directions]
+        return [self + direction for direction in _HEX_DIRECTIONS]
     
     def get_neighbor(self, direction: int) -> 'HexCoord':
         """
@@ -215,12 +297,7 @@ class HexCoord:
         Returns:
             The neighboring HexCoord in the specified direction
         """
-        directions = [
-            HexCoord(1, -1, 0), HexCoord(1, 0, -1), HexCoord(0, 1, -1),
-            HexCoord(-1, 1, 0), HexCoord(-1, 0, 1), HexCoord(0, -1, 1)
-        ]
-        
-        return self + directions[direction % 6]
+        return self + _HEX_DIRECTIONS[direction % 6]
     
     def get_range(self, radius: int) -> List['HexCoord']:
         """
@@ -232,14 +309,27 @@ class HexCoord:
         Returns:
             A list of all HexCoord objects within the specified radius
         """
-        results = []
-        
-        for x in range(-radius, radius + 1):
-            for y in range(max(-radius, -x - radius), min(radius, -x + radius) + 1):
-                z = -x - y
-                results.append(HexCoord(self.x + x, self.y + y, self.z + z))
+        return [HexCoord.raw(x, y, z) for x, y, z in self.get_range_array(radius).tolist()]
+    
+    def get_range_array(self, radius: int) -> np.ndarray:
+        """
+        Get all hexes within a certain range as an array of cube coordinates.
         
-        return results
+        Args:
+            radius: The range in hex steps
+            
+        Returns:
+            An (N, 3) int32 array of (x, y, z) rows, in the same order as get_range
+        """
+        offsets = np.arange(-radius, radius + 1, dtype=np.int32)
+        xs, ys = np.meshgrid(offsets, offsets, indexing='ij')
+        zs = -xs - ys
+        in_range = (zs >= -radius) & (zs <= radius)
+        
+        return np.stack(
+            (xs[in_range] + self.x, ys[in_range] + self.y, zs[in_range] + self.z),
+            axis=1
+        ).astype(np.int32, copy=False)
     
     # Line and line of sight calculations
     
@@ -258,33 +348,43 @@ class HexCoord:
         if N == 0:
             return [self]
         
-        results = []
-        step = 1.0 / max(N, 1)
+        return [HexCoord.raw(x, y, z) for x, y, z in self.linedraw_array(other).tolist()]
+    
+    def linedraw_array(self, other: 'HexCoord') -> np.ndarray:
+        """
+        Draw a line from this hex to another as an array of cube coordinates.
         
-        # Linear interpolation between the two points
-        for i in range(N + 1):
-            t = step * i
-            x = round(self.x * (1 - t) + other.x * t)
-            y = round(self.y * (1 - t) + other.y * t)
-            z = round(self.z * (1 - t) + other.z * t)
-            
-            # Handle rounding errors
-            if x + y + z != 0:
-                # Find the component with the largest rounding adjustment
-                abs_dx = abs(x - (self.x * (1 - t) + other.x * t))
-                abs_dy = abs(y - (self.y * (1 - t) + other.y * t))
-                abs_dz = abs(z - (self.z * (1 - t) + other.z * t))
-                
-                if abs_dx >= abs_dy and abs_dx >= abs_dz:
-                    x = -y - z
-                elif abs_dy >= abs_dz:
-                    y = -x - z
-                else:
-                    z = -x - y
+        Args:
+            other: The target HexCoord
             
-            results.append(HexCoord(x, y, z))
+        Returns:
+            An (N+1, 3) int32 array of (x, y, z) rows, the same hexes as linedraw
+        """
+        N = self.distance(other)
         
-        return results
+        # Linear interpolation between the two points
+        ts = np.arange(N + 1) * (1.0 / max(N, 1))
+        xs_f = self.x * (1 - ts) + other.x * ts
+        ys_f = self.y * (1 - ts) + other.y * ts
+        zs_f = self.z * (1 - ts) + other.z * ts
+        xs = np.round(xs_f)
+        ys = np.round(ys_f)
+        zs = np.round(zs_f)
+        
+        # Handle rounding errors: recompute the component with the largest
+        # rounding adjustment from the other two
+        bad = xs + ys + zs != 0
+        dx = np.abs(xs - xs_f)
+        dy = np.abs(ys - ys_f)
+        dz = np.abs(zs - zs_f)
+        fix_x = bad & (dx >= dy) & (dx >= dz)
+        fix_y = bad & ~fix_x & (dy >= dz)
+        fix_z = bad & ~fix_x & ~fix_y
+        xs[fix_x] = -ys[fix_x] - zs[fix_x]
+        ys[fix_y] = -xs[fix_y] - zs[fix_y]
+        zs[fix_z] = -xs[fix_z] - ys[fix_z]
+        
+        return np.stack((xs, ys, zs), axis=1).astype(np.int32)
     
     def has_line_of_sight(self, other: 'HexCoord', blockers: Set['HexCoord']) -> bool:
         """
@@ -307,6 +407,40 @@ class HexCoord:
         
         return True
     
+    def has_line_of_sight_batch(self, targets: List['HexCoord'], blockers: Set['HexCoord']) -> np.ndarray:
+        """
+        Determine line of sight from this hex to many targets at once.
+        
+        Args:
+            targets: The target HexCoords
+            blockers: A set of HexCoord objects that block line of sight
+            
+        Returns:
+            A bool array, True where the target at that index is visible
+        """
+        visible = np.ones(len(targets), dtype=bool)
+        if not blockers or not targets:
+            return visible
+        
+        # Pack (x, z) into one int64 key per hex (y is implied by x and z)
+        blocker_keys = np.array(
+            [_pack_xz(blocker.x, blocker.z) for blocker in blockers],
+            dtype=np.int64
+        )
+        
+        # Interior hexes of every line, tagged with the index of their target
+        interiors = [self.linedraw_array(target)[1:-1] for target in targets]
+        lengths = [len(interior) for interior in interiors]
+        if not any(lengths):
+            return visible
+        
+        hexes = np.concatenate(interiors).astype(np.int64)
+        owners = np.repeat(np.arange(len(targets)), lengths)
+        keys = (hexes[:, 0] << 32) | (hexes[:, 2] & 0xFFFFFFFF)
+        
+        visible[owners[np.isin(keys, blocker_keys)]] = False
+        return visible
+    
     # Conversion to/from screen coordinates
     
     def to_pixel(self, orientation: HexOrientation, size: float, origin: Tuple[float, float]) -> Tuple[float, float]:
@@ -357,6 +491,68 @@ class HexCoord:
         # Convert to rounded cube coordinates
         return cls.cube_round(q, -q-r, r)
     
+    @staticmethod
+    def to_pixel_batch(coords: np.ndarray, orientation: HexOrientation,
+                       size: float, origin: Tuple[float, float]) -> np.ndarray:
+        """
+        Convert many hex coordinates to pixel coordinates at once.
+        
+        Args:
+            coords: An (N, 3) array of (x, y, z) cube coordinates
+            orientation: POINTY_TOP or FLAT_TOP
+            size: Size of a hex (distance from center to corner)
+            origin: Pixel coordinates of the grid origin (0,0,0)
+            
+        Returns:
+            An (N, 2) float array of (x, y) pixel coordinates, as to_pixel gives
+        """
+        coords = np.asarray(coords, dtype=float)
+        (f0, f1), (f2, f3) = _FORWARD_MATRICES[orientation]
+        xs = coords[:, 0]
+        ys = coords[:, 1]
+        
+        # Same operation order as to_pixel, so results match it exactly
+        pixels = np.empty((len(coords), 2))
+        pixels[:, 0] = (f0 * xs + f1 * ys) * size + origin[0]
+        pixels[:, 1] = (f2 * xs + f3 * ys) * size + origin[1]
+        return pixels
+    
+    @staticmethod
+    def from_pixel_batch(pixels: np.ndarray, orientation: HexOrientation,
+                         size: float, origin: Tuple[float, float]) -> np.ndarray:
+        """
+        Convert many pixel coordinates to the nearest hex coordinates at once.
+        
+        Args:
+            pixels: An (N, 2) array of (x, y) pixel coordinates
+            orientation: POINTY_TOP or FLAT_TOP
+            size: Size of a hex (distance from center to corner)
+            origin: Pixel coordinates of the grid origin (0,0,0)
+            
+        Returns:
+            An (N, 3) int32 array of (x, y, z) cube coordinates, as from_pixel gives
+        """
+        pixels = np.asarray(pixels, dtype=float)
+        (b0, b1), (b2, b3) = _BACKWARD_MATRICES[orientation]
+        px = (pixels[:, 0] - origin[0]) / size
+        py = (pixels[:, 1] - origin[1]) / size
+        q = b0 * px + b1 * py
+        r = b2 * px + b3 * py
+        
+        # Vectorized cube_round
+        cube = np.stack((q, -q - r, r), axis=1)
+        rounded = np.round(cube)
+        diffs = np.abs(rounded - cube)
+        rx, ry, rz = rounded[:, 0], rounded[:, 1], rounded[:, 2]
+        fix_x = (diffs[:, 0] > diffs[:, 1]) & (diffs[:, 0] > diffs[:, 2])
+        fix_y = ~fix_x & (diffs[:, 1] > diffs[:, 2])
+        fix_z = ~fix_x & ~fix_y
+        rx[fix_x] = -ry[fix_x] - rz[fix_x]
+        ry[fix_y] = -rx[fix_y] - rz[fix_y]
+        rz[fix_z] = -rx[fix_z] - ry[fix_z]
+        
+        return rounded.astype(np.int32)
+    
     @classmethod
     def cube_round(cls, x: float, y: float, z: float) -> 'HexCoord':
         """
@@ -387,7 +583,7 @@ class HexCoord:
         else:
             rz = -rx - ry
         
-        return cls(rx, ry, rz)
+        return cls.raw(rx, ry, rz)
     
     def get_corner_pixel(self, orientation: HexOrientation, corner: int, 
                         size: float, origin: Tuple[float, float]) -> Tuple[float, float]:
@@ -403,13 +599,12 @@ class HexCoord:
         Returns:
             A tuple of (x, y) pixel coordinates for the corner
         """
-        M = POINTY_TOP if orientation == HexOrientation.POINTY_TOP else FLAT_TOP
         center = self.to_pixel(orientation, size, origin)
-        angle = 2.0 * math.pi * (M.start_angle + corner) / 6.0
+        unit_x, unit_y = _CORNER_UNITS[orientation][corner % 6]
         
         return (
-            center[0] + size * math.cos(angle),
-            center[1] + size * math.sin(angle)
+            center[0] + size * unit_x,
+            center[1] + size * unit_y
         )
     
     def get_all_corners_pixel(self, orientation: HexOrientation, 
@@ -425,7 +620,41 @@ class HexCoord:
         Returns:
             A list of (x, y) pixel coordinates for all corners
         """
-        return [self.get_corner_pixel(orientation, i, size, origin) for i in range(6)]
+        center_x, center_y = self.to_pixel(orientation, size, origin)
+        
+        return [
+            (center_x + size * unit_x, center_y + size * unit_y)
+            for unit_x, unit_y in _CORNER_UNITS[orientation]
+        ]
+    
+    @staticmethod
+    def corners_pixel_array(coords: np.ndarray, orientation: HexOrientation,
+                            size: float, origin: Tuple[float, float]) -> np.ndarray:
+        """
+        Get the pixel coordinates of all corners of many hexes at once.
+        
+        Args:
+            coords: An (N, 3) array of (x, y, z) cube coordinates
+            orientation: POINTY_TOP or FLAT_TOP
+            size: Size of a hex (distance from center to corner)
+            origin: Pixel coordinates of the grid origin (0,0,0)
+            
+        Returns:
+            An (N, 6, 2) float array of corner (x, y) pixel coordinates
+        """
+        centers = HexCoord.to_pixel_batch(coords, orientation, size, origin)
+        
+        return centers[:, np.newaxis, :] + size * _CORNER_UNIT_ARRAYS[orientation]
+
+
+# The six neighbor directions in cube coordinates: (x, y, z)
+_HEX_DIRECTIONS = tuple(
+    HexCoord(x, y, z)
+    for x, y, z in [(1, -1, 0), (1, 0, -1), (0, 1, -1), (-1, 1, 0), (-1, 0, 1), (0, -1, 1)]
+)
+
+# The same directions in axial coordinates: (q, r)
+_AXIAL_DIRECTIONS = tuple((direction.x, direction.z) for direction in _HEX_DIRECTIONS)
 
 
 class HexCell:
@@ -473,8 +702,14 @@ class HexGrid:
     """
     Manages a hexagonal grid of cells.
     Handles storage, retrieval, and operations on the grid.
+    
+    Cells are stored as parallel per-cell arrays (structure of arrays) with
+    a map from axial (q, r) coordinates to row index. HexCell objects are
+    built on demand by get_cell; use set_cell to change a cell.
     """
     
+    _INITIAL_CAPACITY = 64
+    
     def __init__(self, orientation: HexOrientation = HexOrientation.POINTY_TOP, 
                  hex_size: float = 10.0,
                  origin: Tuple[float, float] = (0, 0)):
@@ -489,19 +724,84 @@ class HexGrid:
         self.orientation = orientation
         self.hex_size = hex_size
         self.origin = origin
-        self.cells: Dict[HexCoord, HexCell] = {}
+        
+        # Per-cell columns; rows [0, _size) are in use
+        self._size = 0
+        self._qs = np.zeros(self._INITIAL_CAPACITY, dtype=np.int32)
+        self._rs = np.zeros(self._INITIAL_CAPACITY, dtype=np.int32)
+        self._cost = np.zeros(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._blocks = np.zeros(self._INITIAL_CAPACITY, dtype=np.uint8)
+        self._terrain_id = np.zeros(self._INITIAL_CAPACITY, dtype=np.int16)
+        self._metadata: List[Dict[str, Any]] = []
+        
+        # Axial (q, r) -> row index, in insertion order, and back
+        self._index: Dict[Tuple[int, int], int] = {}
+        self._keys: List[Tuple[int, int]] = []
+        
+        # Terrain names interned as small ids
+        self._terrain_names: List[str] = []
+        self._terrain_ids: Dict[str, int] = {}
+        
+        # Packed (x, z) keys of the cells that block sight
+        self._blocker_keys: Set[int] = set()
+        
+        # Pathfinding adjacency indexed by row, [(neighbor row, movement cost)]
+        # or None until built; invalidated by set_cell/remove_cell
+        self._adj: List[Optional[List[Tuple[int, float]]]] = []
+    
+    def __len__(self) -> int:
+        """Number of cells in the grid."""
+        return self._size
+    
+    @property
+    def orientation(self) -> HexOrientation:
+        """POINTY_TOP or FLAT_TOP."""
+        return self._orientation
+    
+    @orientation.setter
+    def orientation(self, orientation: HexOrientation) -> None:
+        # Bind this orientation's layout constants once, for hex_to_pixel
+        # and pixel_to_hex
+        M = POINTY_TOP if orientation == HexOrientation.POINTY_TOP else FLAT_TOP
+        self._orientation = orientation
+        self._f = (M.f0, M.f1, M.f2, M.f3)
+        self._b = (M.b0, M.b1, M.b2, M.b3)
+    
+    def _grow(self) -> None:
+        """Double the capacity of the per-cell arrays."""
+        capacity = len(self._qs) * 2
+        for name in ("_qs", "_rs", "_cost", "_blocks", "_terrain_id"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+    
+    def _cell_at(self, row: int) -> HexCell:
+        """Build a HexCell from the arrays at a row."""
+        return HexCell(
+            terrain_type=self._terrain_names[self._terrain_id[row]],
+            movement_cost=float(self._cost[row]),
+            blocks_sight=bool(self._blocks[row]),
+            metadata=self._metadata[row]
+        )
     
     def get_cell(self, coord: HexCoord) -> Optional[HexCell]:
         """
         Get the cell at the specified coordinates.
         
+        The returned HexCell is a copy of the stored values (sharing only the
+        metadata dict); pass it back to set_cell to change the grid.
+        
         Args:
             coord: The hex coordinates
             
         Returns:
             The HexCell at those coordinates, or None if not found
         """
-        return self.cells.get(coord)
+        row = self._index.get((coord.x, coord.z))
+        if row is None:
+            return None
+        return self._cell_at(row)
     
     def set_cell(self, coord: HexCoord, cell: HexCell) -> None:
         """
@@ -511,7 +811,35 @@ class HexGrid:
             coord: The hex coordinates
             cell: The HexCell to place at those coordinates
         """
-        self.cells[coord] = cell
+        key = (coord.x, coord.z)
+        row = self._index.get(key)
+        if row is None:
+            if self._size == len(self._qs):
+                self._grow()
+            row = self._size
+            self._size += 1
+            self._index[key] = row
+            self._keys.append(key)
+            self._qs[row] = coord.x
+            self._rs[row] = coord.z
+            self._metadata.append(cell.metadata)
+            self._adj.append(None)
+        else:
+            self._metadata[row] = cell.metadata
+        
+        terrain_id = self._terrain_ids.get(cell.terrain_type)
+        if terrain_id is None:
+            terrain_id = self._terrain_ids[cell.terrain_type] = len(self._terrain_names)
+            self._terrain_names.append(cell.terrain_type)
+        
+        self._terrain_id[row] = terrain_id
+        self._cost[row] = cell.movement_cost
+        self._blocks[row] = cell.blocks_sight
+        if cell.blocks_sight:
+            self._blocker_keys.add(_pack_xz(coord.x, coord.z))
+        else:
+            self._blocker_keys.discard(_pack_xz(coord.x, coord.z))
+        self._invalidate_adjacency(coord)
     
     def remove_cell(self, coord: HexCoord) -> None:
         """
@@ -520,8 +848,85 @@ class HexGrid:
         Args:
             coord: The hex coordinates to remove
         """
-        if coord in self.cells:
-            del self.cells[coord]
+        row = self._index.pop((coord.x, coord.z), None)
+        if row is None:
+            return
+        self._blocker_keys.discard(_pack_xz(coord.x, coord.z))
+        
+        # Move the last row into the freed slot
+        last = self._size - 1
+        if row != last:
+            for column in (self._qs, self._rs, self._cost, self._blocks, self._terrain_id):
+                column[row] = column[last]
+            self._metadata[row] = self._metadata[last]
+            self._keys[row] = self._keys[last]
+            self._index[self._keys[row]] = row
+        self._metadata.pop()
+        self._keys.pop()
+        self._size = last
+        
+        # Row numbers may have moved, so drop all cached adjacency
+        self._adj = [None] * last
+    
+    def _invalidate_adjacency(self, coord: HexCoord) -> None:
+        """
+        Drop cached adjacency lists that depend on the cell at coord.
+        
+        Args:
+            coord: The hex coordinates whose cell changed
+        """
+        index = self._index
+        for dq, dr in ((0, 0),) + _AXIAL_DIRECTIONS:
+            row = index.get((coord.x + dq, coord.z + dr))
+            if row is not None:
+                self._adj[row] = None
+    
+    def hex_to_pixel(self, coord: HexCoord,
+                     origin: Optional[Tuple[float, float]] = None) -> Tuple[float, float]:
+        """
+        Convert hex coordinates to pixel coordinates using this grid's layout.
+        
+        Same result as coord.to_pixel with the grid's orientation and size.
+        
+        Args:
+            coord: The hex coordinates
+            origin: Pixel coordinates of the grid origin, the grid's own if None
+            
+        Returns:
+            A tuple of (x, y) pixel coordinates
+        """
+        f0, f1, f2, f3 = self._f
+        size = self.hex_size
+        ox, oy = self.origin if origin is None else origin
+        x = coord.x
+        y = coord.y
+        
+        return ((f0 * x + f1 * y) * size + ox, (f2 * x + f3 * y) * size + oy)
+    
+    def pixel_to_hex(self, x: float, y: float,
+                     origin: Optional[Tuple[float, float]] = None) -> HexCoord:
+        """
+        Convert pixel coordinates to the nearest hex using this grid's layout.
+        
+        Same result as HexCoord.from_pixel with the grid's orientation and size.
+        
+        Args:
+            x: Pixel x-coordinate
+            y: Pixel y-coordinate
+            origin: Pixel coordinates of the grid origin, the grid's own if None
+            
+        Returns:
+            The nearest HexCoord
+        """
+        b0, b1, b2, b3 = self._b
+        size = self.hex_size
+        ox, oy = self.origin if origin is None else origin
+        px = (x - ox) / size
+        py = (y - oy) / size
+        q = b0 * px + b1 * py
+        r = b2 * px + b3 * py
+        
+        return HexCoord.cube_round(q, -q - r, r)
     
     def get_all_coords(self) -> List[HexCoord]:
         """
@@ -530,7 +935,61 @@ class HexGrid:
         Returns:
             A list of all HexCoord objects in the grid
         """
-        return list(self.cells.keys())
+        return [HexCoord.raw(q, -q - r, r) for q, r in self._index]
+    
+    def coords_array(self) -> np.ndarray:
+        """
+        Get all coordinates in the grid as an array.
+        
+        Returns:
+            An (N, 3) int32 array of (x, y, z) cube coordinates, in row order
+        """
+        qs = self._qs[:self._size]
+        rs = self._rs[:self._size]
+        return np.stack([qs, -qs - rs, rs], axis=1).astype(np.int32)
+    
+    def lookup_rows(self, qs: np.ndarray, rs: np.ndarray) -> np.ndarray:
+        """
+        Find the row index of many axial coordinates at once.
+        
+        Args:
+            qs: Array of q coordinates (cube x)
+            rs: Array of r coordinates (cube z), the same shape as qs
+            
+        Returns:
+            An int64 array shaped like qs of row indices, -1 where there is no cell
+        """
+        qs = np.asarray(qs, dtype=np.int64)
+        rs = np.asarray(rs, dtype=np.int64)
+        rows = np.full(qs.shape, -1, dtype=np.int64)
+        size = self._size
+        if size == 0:
+            return rows
+        
+        # Binary search over sorted packed (q, r) keys
+        keys = (self._qs[:size].astype(np.int64) << 32) | (self._rs[:size].astype(np.int64) & 0xFFFFFFFF)
+        order = np.argsort(keys)
+        sorted_keys = keys[order]
+        query = (qs << 32) | (rs & 0xFFFFFFFF)
+        positions = np.minimum(np.searchsorted(sorted_keys, query), size - 1)
+        found = sorted_keys[positions] == query
+        rows[found] = order[positions[found]]
+        
+        return rows
+    
+    def terrain_ids(self) -> np.ndarray:
+        """
+        Get the terrain id of every cell, in row order.
+        
+        Returns:
+            An (N,) int16 array indexing terrain_names
+        """
+        return self._terrain_id[:self._size]
+    
+    @property
+    def terrain_names(self) -> Tuple[str, ...]:
+        """Terrain type names, indexed by the ids from terrain_ids."""
+        return tuple(self._terrain_names)
     
     def is_in_bounds(self, coord: HexCoord) -> bool:
         """
@@ -542,10 +1001,56 @@ class HexGrid:
         Returns:
             True if the coordinates are in the grid, False otherwise
         """
-        return coord in self.cells
+        return (coord.x, coord.z) in self._index
+    
+    def has_line_of_sight(self, start: HexCoord, end: HexCoord) -> bool:
+        """
+        Determine if there's a clear line of sight between two hexes,
+        using the cells of this grid that block sight.
+        
+        Args:
+            start: The starting HexCoord
+            end: The target HexCoord
+            
+        Returns:
+            True if no interior hex of the line blocks sight, False otherwise
+        """
+        blocker_keys = self._blocker_keys
+        if not blocker_keys:
+            return True
+        
+        for x, _, z in start.linedraw_array(end)[1:-1].tolist():
+            if (x << 32) | (z & 0xFFFFFFFF) in blocker_keys:
+                return False
+        
+        return True
     
     # Pathfinding methods
     
+    def _row_neighbors(self, row: int) -> List[Tuple[int, float]]:
+        """
+        Get the cached (neighbor row, movement cost) list for a row.
+        
+        Args:
+            row: The row index of a cell
+            
+        Returns:
+            A list of tuples (neighbor_row, movement_cost), shared with the
+            cache and not to be modified
+        """
+        neighbors = self._adj[row]
+        if neighbors is None:
+            q, r = self._keys[row]
+            index = self._index
+            neighbors = []
+            for dq, dr in _AXIAL_DIRECTIONS:
+                neighbor_row = index.get((q + dq, r + dr))
+                if neighbor_row is not None:
+                    neighbors.append((neighbor_row, float(self._cost[neighbor_row])))
+            self._adj[row] = neighbors
+        
+        return neighbors
+    
     def get_neighbors_for_pathfinding(self, coord: HexCoord) -> List[Tuple[HexCoord, float]]:
         """
         Get neighboring coordinates and movement costs for pathfinding.
@@ -557,74 +1062,123 @@ class HexGrid:
             A list of tuples (neighbor_coord, movement_cost)
         """
         neighbors = []
-        
-        for neighbor_coord in coord.get_neighbors():
-            cell = self.get_cell(neighbor_coord)
-            if cell:
-                neighbors.append((neighbor_coord, cell.movement_cost))
+        index = self._index
+        for direction in _HEX_DIRECTIONS:
+            neighbor_coord = coord + direction
+            row = index.get((neighbor_coord.x, neighbor_coord.z))
+            if row is not None:
+                neighbors.append((neighbor_coord, float(self._cost[row])))
         
         return neighbors
     
-    def find_path(self, start: HexCoord, goal: HexCoord) -> List[HexCoord]:
+    def prebuild_adjacency(self) -> None:
+        """
+        Build the pathfinding adjacency lists for every cell up front.
+        Useful for static grids that will be searched many times.
+        
+        The lists are cached per cell; call set_cell again after changing a
+        cell's movement cost in place so the cache is refreshed.
+        """
+        size = self._size
+        if size == 0:
+            return
+        
+        # Find every neighbor row at once; -1 marks a missing neighbor
+        directions = np.array(_AXIAL_DIRECTIONS, dtype=np.int64)
+        neighbor_rows = self.lookup_rows(
+            self._qs[:size, np.newaxis] + directions[:, 0],
+            self._rs[:size, np.newaxis] + directions[:, 1]
+        )
+        neighbor_costs = self._cost[:size][neighbor_rows]
+        
+        self._adj = [
+            [(neighbor, cost) for neighbor, cost in zip(rows, costs) if neighbor >= 0]
+            for rows, costs in zip(neighbor_rows.tolist(), neighbor_costs.tolist())
+        ]
+    
+    def find_path(self, start: HexCoord, goal: HexCoord,
+                  max_cost: float = float('inf')) -> List[HexCoord]:
         """
         Find a path between two coordinates using A* algorithm.
         
         Args:
             start: Starting hex coordinates
             goal: Target hex coordinates
+            max_cost: Largest total movement cost allowed; paths costing
+                more are not explored
             
         Returns:
             A list of HexCoord objects forming the path (including start and goal),
             or an empty list if no path is found
         """
-        # If either start or goal is not in the grid, return empty path
-        if not self.is_in_bounds(start) or not self.is_in_bounds(goal):
-            return []
-        
-        # A* algorithm implementation
-        open_set = {start}
-        closed_set = set()
+        start_row = self._index.get((start.x, start.z))
+        goal_row = self._index.get((goal.x, goal.z))
         
-        # Came_from maps each node to its predecessor in the optimal path
-        came_from = {}
-        
-        # g_score maps each node to its cost from the start
-        g_score = {start: 0}
-        
-        # f_score maps each node to its estimated total cost (g_score + heuristic)
-        f_score = {start: start.distance(goal)}
+        # If either start or goal is not in the grid, or no path fits the
+        # budget, return empty path
+        if start_row is None or goal_row is None or max_cost < 0:
+            return []
         
-        while open_set:
-            # Find the node in open_set with the lowest f_score
-            current = min(open_set, key=lambda h: f_score.get(h, float('inf')))
+        # A* over row indices, so the hot loop only hashes and compares ints.
+        # The open set is a heap of (f_score, row); entries made stale by a
+        # better path are skipped when popped rather than removed.
+        keys = self._keys
+        goal_q, goal_r = keys[goal_row]
+        open_heap = [(start.distance(goal), start_row)]
+        closed = bytearray(self._size)
+        
+        # Came_from holds each row's predecessor in the optimal path, -1 if none
+        came_from = [-1] * self._size
+        
+        # g_score holds each row's cost from the start, inf if not reached
+        g_score = [float('inf')] * self._size
+        g_score[start_row] = 0
+        
+        # Locals for the hot loop
+        adj = self._adj
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        while open_heap:
+            # Pop the row with the lowest f_score
+            _, current = heappop(open_heap)
+            if closed[current]:
+                continue
             
-            if current == goal:
+            if current == goal_row:
                 # Reconstruct the path
-                path = [current]
-                while current in came_from:
-                    current = came_from[current]
+                path = []
+                while current != -1:
                     path.append(current)
+                    current = came_from[current]
                 path.reverse()
-                return path
+                return [HexCoord.raw(q, -q - r, r) for q, r in map(keys.__getitem__, path)]
             
-            open_set.remove(current)
-            closed_set.add(current)
+            closed[current] = 1
+            current_g_score = g_score[current]
             
-            for neighbor, cost in self.get_neighbors_for_pathfinding(current):
-                if neighbor in closed_set:
+            neighbors = adj[current]
+            if neighbors is None:
+                neighbors = self._row_neighbors(current)
+            
+            for neighbor, cost in neighbors:
+                if closed[neighbor]:
                     continue
                 
-                tentative_g_score = g_score.get(current, float('inf')) + cost
-                
-                if neighbor not in open_set:
-                    open_set.add(neighbor)
-                elif tentative_g_score >= g_score.get(neighbor, float('inf')):
+                tentative_g_score = current_g_score + cost
+                if tentative_g_score >= g_score[neighbor] or tentative_g_score > max_cost:
                     continue
                 
+                # Hex distance to the goal, from axial coordinates
+                neighbor_q, neighbor_r = keys[neighbor]
+                dq = neighbor_q - goal_q
+                dr = neighbor_r - goal_r
+                f_score = tentative_g_score + ((abs(dq) + abs(dr) + abs(dq + dr)) >> 1)
+                
                 # This path is the best so far
                 came_from[neighbor] = current
                 g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = tentative_g_score + neighbor.distance(goal)
+                heappush(open_heap, (f_score, neighbor))
         
         # No path found
         return []
@@ -640,10 +1194,10 @@ class HexGrid:
         """
         cells_dict = {}
         
-        for coord, cell in self.cells.items():
+        for (q, r), row in self._index.items():
             # Convert HexCoord to string for JSON
-            key = f"{coord.x},{coord.y},{coord.z}"
-            cells_dict[key] = cell.to_dict()
+            key = f"{q},{-q - r},{r}"
+            cells_dict[key] = self._cell_at(row).to_dict()
         
         return {
             "orientation": self.orientation.value,
@@ -705,6 +1259,84 @@ class HexGrid:
         data = json.loads(json_str)
         return cls.from_dict(data)
     
+    def to_npz(self, file: Union[str, BinaryIO]) -> None:
+        """
+        Save the grid as a compressed NumPy archive.
+        
+        The per-cell columns are written as arrays, so saving and loading
+        avoid formatting and parsing a string key per cell. Cell metadata
+        is stored as a JSON string alongside them.
+        
+        Args:
+            file: Path or writable binary file object
+        """
+        size = self._size
+        metadata = {str(row): meta for row, meta in enumerate(self._metadata) if meta}
+        
+        np.savez_compressed(
+            file,
+            orientation=np.int8(self.orientation.value),
+            hex_size=np.float64(self.hex_size),
+            origin=np.array(self.origin, dtype=np.float64),
+            coords=self.coords_array(),
+            cost=self._cost[:size],
+            blocks=self._blocks[:size],
+            terrain_ids=self._terrain_id[:size],
+            terrain_table=np.array(self._terrain_names, dtype=np.str_),
+            metadata=np.array(json.dumps(metadata))
+        )
+    
+    @classmethod
+    def from_npz(cls, file: Union[str, BinaryIO]) -> 'HexGrid':
+        """
+        Load a grid saved by to_npz.
+        
+        Args:
+            file: Path or readable binary file object
+            
+        Returns:
+            A new HexGrid object
+        """
+        with np.load(file, allow_pickle=False) as data:
+            origin = data["origin"]
+            grid = cls(
+                orientation=HexOrientation(int(data["orientation"])),
+                hex_size=float(data["hex_size"]),
+                origin=(float(origin[0]), float(origin[1]))
+            )
+            coords = data["coords"]
+            size = len(coords)
+            capacity = max(cls._INITIAL_CAPACITY, size)
+            
+            # Fill the columns directly instead of going through set_cell
+            grid._qs = np.zeros(capacity, dtype=np.int32)
+            grid._rs = np.zeros(capacity, dtype=np.int32)
+            grid._cost = np.zeros(capacity, dtype=np.float64)
+            grid._blocks = np.zeros(capacity, dtype=np.uint8)
+            grid._terrain_id = np.zeros(capacity, dtype=np.int16)
+            grid._qs[:size] = coords[:, 0]
+            grid._rs[:size] = coords[:, 2]
+            grid._cost[:size] = data["cost"]
+            grid._blocks[:size] = data["blocks"]
+            grid._terrain_id[:size] = data["terrain_ids"]
+            grid._size = size
+            
+            grid._terrain_names = data["terrain_table"].tolist()
+            grid._terrain_ids = {name: i for i, name in enumerate(grid._terrain_names)}
+            
+            blocking = np.flatnonzero(grid._blocks[:size])
+            grid._blocker_keys = {
+                _pack_xz(q, r) for q, r in zip(grid._qs[blocking].tolist(), grid._rs[blocking].tolist())
+            }
+            
+            metadata = json.loads(str(data["metadata"]))
+            grid._metadata = [metadata.get(str(row), {}) for row in range(size)]
+            grid._adj = [None] * size
+        
+        grid._keys = list(zip(grid._qs[:size].tolist(), grid._rs[:size].tolist()))
+        grid._index = {key: row for row, key in enumerate(grid._keys)}
+        return grid
+    
     # Utility methods
     
     def create_rectangle(self, width: int, height: int, 
@@ -736,6 +1368,6 @@ class HexGrid:
         """
         center = center or HexCoord(0, 0, 0)
         
-        for coord in center.get_range(radius):
+        for x, y, z in center.get_range_array(radius).tolist():
             cell = HexCell(terrain_type=terrain_type)
-            self.set_cell(coord, cell)
+            self.set_cell(HexCoord.raw(x, y, z), cell)
@@ -12,10 +12,11 @@ from tcod import libtcodpy
 from tcod.context import new_terminal
 from tcod.console import Console
 import tcod.event as event
+import numpy as np
 
 from src.engine.hex_grid import HexCoord, HexGrid, HexOrientation, HexCell
 from src.engine.hex_renderer import HexRenderer
-from src.config import Config
+from src.config import CONFIG
 
 # Keyboard constants
 K_ESCAPE = 27  # ASCII for ESC
@@ -26,30 +27,70 @@ K_RIGHT = 1073741903  # Common value for RIGHT arrow
 K_p = 112  # ASCII for 'p'
 K_TAB = 9  # Tab key for switching modes
 
+# Location of Port Royal, the pathfinding goal
+PORT_COORD = HexCoord.from_axial(3, -1)
+
+# Navigation modes and their banner text
+CAMERA_MODE = 0
+CURSOR_MODE = 1
+MODE_TEXT = {
+    CAMERA_MODE: "MODE: CAMERA",
+    CURSOR_MODE: "MODE: CURSOR",
+}
+MODE_SWITCH_TEXT = {
+    CAMERA_MODE: "Switched to CAMERA mode",
+    CURSOR_MODE: "Switched to CURSOR mode",
+}
+
+# Static instruction lines: (x, y, text, fg)
+INSTRUCTIONS = (
+    (2, 2, "TAB: Switch between Camera/Cursor mode", (255, 255, 255)),
+    (2, 3, "Arrow keys: Move camera or cursor (based on mode)", (255, 255, 255)),
+    (2, 4, "P: Test pathfinding from cursor to port", (255, 255, 255)),
+    (2, 5, "ESC: Quit", (255, 255, 255)),
+)
+
+# Camera moves per arrow key as (axis, direction) of camera_offset
+CAMERA_MOVES = {
+    K_UP: (1, -1),
+    K_DOWN: (1, 1),
+    K_LEFT: (0, -1),
+    K_RIGHT: (0, 1),
+}
+
+# Cursor moves per arrow key as cube direction vectors, nearest first; the
+# second is used when the first neighbor is off the grid
+CURSOR_DIRECTIONS = {
+    K_UP: (HexCoord(0, 1, -1), HexCoord(1, 0, -1)),
+    K_DOWN: (HexCoord(-1, 0, 1), HexCoord(0, -1, 1)),
+    K_LEFT: (HexCoord(-1, 1, 0), HexCoord(-1, 0, 1)),
+    K_RIGHT: (HexCoord(1, 0, -1), HexCoord(1, -1, 0)),
+}
+
 def run_hex_grid_test():
     """Run a test of the hex grid implementation."""
     # Set up the font
     libtcodpy.console_set_custom_font(
-        Config.FONT_PATH,
-        Config.FONT_FLAGS
+        CONFIG.FONT_PATH,
+        CONFIG.FONT_FLAGS
     )
     
     # Create a context (window) using the newer API
     context = new_terminal(
-        Config.SCREEN_WIDTH,
-        Config.SCREEN_HEIGHT,
-        title=Config.WINDOW_TITLE,
+        CONFIG.SCREEN_WIDTH,
+        CONFIG.SCREEN_HEIGHT,
+        title=CONFIG.WINDOW_TITLE,
         vsync=True
     )
     
     # Create main console for rendering
-    console = Console(Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+    console = Console(CONFIG.SCREEN_WIDTH, CONFIG.SCREEN_HEIGHT)
     
     # Create a hex grid
     grid = HexGrid(
         orientation=HexOrientation.POINTY_TOP,
         hex_size=20.0,
-        origin=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2)
+        origin=(CONFIG.SCREEN_WIDTH // 2, CONFIG.SCREEN_HEIGHT // 2)
     )
     
     # Create a hexagonal pattern
@@ -76,96 +117,91 @@ def run_hex_grid_test():
                 grid.set_cell(coord, cell)
     
     # Add a port
-    port_coord = HexCoord.from_axial(3, -1)
     port_cell = HexCell(terrain_type="port", movement_cost=1.0, metadata={"name": "Port Royal"})
-    grid.set_cell(port_coord, port_cell)
+    grid.set_cell(PORT_COORD, port_cell)
+    
+    # Get a list of all coordinates in the grid for cursor navigation,
+    # sorted by (z, x) for consistent navigation
+    coords = grid.coords_array()
+    order = np.lexsort((coords[:, 0], coords[:, 2]))
+    coords = coords[order]
+    all_coords = [HexCoord.raw(x, y, z) for x, y, z in coords.tolist()]
+    
+    coord_to_index = {coord: i for i, coord in enumerate(all_coords)}
     
-    # Get a list of all coordinates in the grid for cursor navigation
-    all_coords = grid.get_all_coords()
-    all_coords.sort(key=lambda c: (c.z, c.x))  # Sort for consistent navigation
+    # Cursor index of each grid row
+    row_to_index = np.empty(len(order), dtype=np.int64)
+    row_to_index[order] = np.arange(len(order))
+    
+    # Precompute, per arrow key, the cursor index it moves to from every
+    # hex; a hex with no neighbor that way maps to itself
+    cursor_moves = {}
+    for key, directions in CURSOR_DIRECTIONS.items():
+        moves = np.arange(len(coords))
+        
+        # Apply the fallback direction first so the preferred one wins
+        for direction in reversed(directions):
+            rows = grid.lookup_rows(coords[:, 0] + direction.x, coords[:, 2] + direction.z)
+            found = rows >= 0
+            moves[found] = row_to_index[rows[found]]
+        cursor_moves[key] = moves.tolist()
     
     # Initialize cursor at center
-    cursor_index = 0
-    if all_coords:
-        for i, coord in enumerate(all_coords):
-            if coord.x == 0 and coord.y == 0 and coord.z == 0:
-                cursor_index = i
-                break
+    cursor_index = coord_to_index.get(HexCoord(0, 0, 0), 0)
     
     # Create the renderer
     renderer = HexRenderer(grid)
     
-    # Set up navigation modes
-    CAMERA_MODE = 0
-    CURSOR_MODE = 1
+    # Set up navigation mode
     current_mode = CAMERA_MODE
     
     # Camera position
     camera_offset = [0, 0]
     camera_speed = 10
     
+    # Selected hex info lines as (y, text), for the hex in info_coord
+    info_coord = None
+    info_lines = ()
+    
     # Main loop
     running = True
+    dirty = True
     while running:
-        # Clear the console
-        console.clear()
-        
-        # Update the selected hex for rendering
-        if all_coords:
-            selected_coord = all_coords[cursor_index]
-            renderer.set_selected_hex(selected_coord)
-        
-        # Render the grid
-        renderer.render(console, camera_offset)
-        
-        # Draw instructions
-        console.print(
-            2, 1,
-            f"MODE: {'CAMERA' if current_mode == CAMERA_MODE else 'CURSOR'}",
-            fg=(255, 255, 0)
-        )
-        console.print(
-            2, 2,
-            "TAB: Switch between Camera/Cursor mode",
-            fg=(255, 255, 255)
-        )
-        console.print(
-            2, 3,
-            "Arrow keys: Move camera or cursor (based on mode)",
-            fg=(255, 255, 255)
-        )
-        console.print(
-            2, 4,
-            "P: Test pathfinding from cursor to port",
-            fg=(255, 255, 255)
-        )
-        console.print(
-            2, 5,
-            "ESC: Quit",
-            fg=(255, 255, 255)
-        )
-        
-        # Draw selected hex info
-        cell = grid.get_cell(selected_coord) if all_coords else None
-        if cell:
-            console.print(
-                2, 7,
-                f"Selected: {selected_coord}",
-                fg=(255, 255, 0)
-            )
-            console.print(
-                2, 8,
-                f"Terrain: {cell.terrain_type}",
-                fg=(255, 255, 0)
-            )
-            console.print(
-                2, 9,
-                f"Movement Cost: {cell.movement_cost}",
-                fg=(255, 255, 0)
-            )
-        
-        # Present the console to the screen
-        context.present(console)
+        # Redraw only after something on screen changed; event.wait() blocks
+        # until input, so an unchanged frame costs nothing
+        if dirty:
+            # Clear the console
+            console.clear()
+            
+            # Update the selected hex for rendering
+            if all_coords:
+                selected_coord = all_coords[cursor_index]
+                renderer.set_selected_hex(selected_coord)
+            
+            # Render the grid
+            renderer.render(console, camera_offset)
+            
+            # Draw instructions
+            console.print(2, 1, MODE_TEXT[current_mode], fg=(255, 255, 0))
+            for x, y, text, fg in INSTRUCTIONS:
+                console.print(x, y, text, fg=fg)
+            
+            # Draw selected hex info, formatted again only when the
+            # selection changes (the grid is fixed while the test runs)
+            if all_coords and selected_coord != info_coord:
+                cell = grid.get_cell(selected_coord)
+                info_lines = (
+                    (7, f"Selected: {selected_coord}"),
+                    (8, f"Terrain: {cell.terrain_type}"),
+                    (9, f"Movement Cost: {cell.movement_cost}"),
+                ) if cell else ()
+                info_coord = selected_coord
+            for y, text in info_lines:
+                console.print(2, y, text, fg=(255, 255, 0))
+            
+            # Present the console to the screen
+            context.present(console)
+            dirty = False
         
         # Process events
         for evt in event.wait():
@@ -179,9 +215,10 @@ def run_hex_grid_test():
                 # Toggle between camera and cursor mode
                 if evt.sym == K_TAB:
                     current_mode = CURSOR_MODE if current_mode == CAMERA_MODE else CAMERA_MODE
+                    dirty = True
                     console.print(
-                        Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2,
-                        f"Switched to {('CAMERA' if current_mode == CAMERA_MODE else 'CURSOR')} mode",
+                        CONFIG.SCREEN_WIDTH // 2, CONFIG.SCREEN_HEIGHT // 2,
+                        MODE_SWITCH_TEXT[current_mode],
                         fg=(255, 255, 0),
                         alignment=libtcodpy.CENTER
                     )
@@ -193,85 +230,46 @@ def run_hex_grid_test():
                     break
                 
                 # Arrow keys - behavior depends on mode
-                elif evt.sym in (K_UP, K_DOWN, K_LEFT, K_RIGHT):
+                elif evt.sym in CAMERA_MOVES:
                     if current_mode == CAMERA_MODE:
                         # Camera mode - move the view
-                        if evt.sym == K_UP:
-                            camera_offset[1] -= camera_speed
-                        elif evt.sym == K_DOWN:
-                            camera_offset[1] += camera_speed
-                        elif evt.sym == K_LEFT:
-                            camera_offset[0] -= camera_speed
-                        elif evt.sym == K_RIGHT:
-                            camera_offset[0] += camera_speed
-                    else:
-                        # Cursor mode - move the cursor
-                        if not all_coords:
-                            continue
-                            
-                        old_coord = all_coords[cursor_index]
-                        
-                        # Try to find the nearest hex in the desired direction
-                        if evt.sym == K_UP:
-                            # Move cursor north
-                            target_coords = [
-                                c for c in all_coords 
-                                if c.z < old_coord.z and abs(c.x - old_coord.x) <= 1
-                            ]
-                        elif evt.sym == K_DOWN:
-                            # Move cursor south
-                            target_coords = [
-                                c for c in all_coords 
-                                if c.z > old_coord.z and abs(c.x - old_coord.x) <= 1
-                            ]
-                        elif evt.sym == K_LEFT:
-                            # Move cursor west
-                            target_coords = [
-                                c for c in all_coords 
-                                if c.x < old_coord.x and abs(c.z - old_coord.z) <= 1
-                            ]
-                        elif evt.sym == K_RIGHT:
-                            # Move cursor east
-                            target_coords = [
-                                c for c in all_coords 
-                                if c.x > old_coord.x and abs(c.z - old_coord.z) <= 1
-                            ]
-                        
-                        # Find the nearest matching hex
-                        if target_coords:
-                            target_coords.sort(key=lambda c: old_coord.distance(c))
-                            new_coord = target_coords[0]
-                            # Find the index of the new coordinate
-                            for i, coord in enumerate(all_coords):
-                                if coord == new_coord:
-                                    cursor_index = i
-                                    break
+                        axis, direction = CAMERA_MOVES[evt.sym]
+                        camera_offset[axis] += direction * camera_speed
+                        dirty = True
+                    elif all_coords:
+                        # Cursor mode - move to the neighbor in that
+                        # direction, if any
+                        new_index = cursor_moves[evt.sym][cursor_index]
+                        if new_index != cursor_index:
+                            cursor_index = new_index
+                            dirty = True
                 
                 # Test pathfinding from cursor to port
-                elif evt.sym == K_p or evt.sym == ord('p'):
+                elif evt.sym == K_p:
                     if all_coords:
                         start = all_coords[cursor_index]
-                        goal = HexCoord.from_axial(3, -1)  # Port Royal
+                        goal = PORT_COORD
                         path = grid.find_path(start, goal)
                         print(f"Path from {start} to {goal}:")
                         for coord in path:
                             print(f"  {coord}")
                         
                         # Highlight the path temporarily
-                        for coord in path:
-                            if coord != start and coord != goal:
-                                # Create a visual path indicator
-                                console.print(
-                                    int(coord.to_pixel(grid.orientation, grid.hex_size, 
-                                                       (grid.origin[0] - camera_offset[0], 
-                                                        grid.origin[1] - camera_offset[1]))[0]),
-                                    int(coord.to_pixel(grid.orientation, grid.hex_size, 
-                                                       (grid.origin[0] - camera_offset[0], 
-                                                        grid.origin[1] - camera_offset[1]))[1]),
-                                    "*",
-                                    fg=(255, 0, 0),
-                                    bg=None
-                                )
+                        view_origin = (grid.origin[0] - camera_offset[0], 
+                                       grid.origin[1] - camera_offset[1])
+                        path_coords = np.array(
+                            [(coord.x, coord.y, coord.z) for coord in path[1:-1]], dtype=np.int32
+                        ).reshape(-1, 3)
+                        pixels = HexCoord.to_pixel_batch(
+                            path_coords, grid.orientation, grid.hex_size, view_origin
+                        ).astype(np.int64)
+                        xs = pixels[:, 0]
+                        ys = pixels[:, 1]
+                        on_screen = (xs >= 0) & (xs < console.width) & (ys >= 0) & (ys < console.height)
+                        
+                        # Mark every hex between start and goal with a red '*'
+                        console.fg[ys[on_screen], xs[on_screen]] = (255, 0, 0)
+                        console.ch[ys[on_screen], xs[on_screen]] = ord('*')
                         context.present(console)
                         # Wait for key press to continue
                         waiting = True
@@ -280,6 +278,9 @@ def run_hex_grid_test():
                                 if isinstance(wait_evt, event.KeyDown):
                                     waiting = False
                                     break
+                        
+                        # Clear the path highlight
+                        dirty = True
 
 if __name__ == "__main__":
     run_hex_grid_test()
\ No newline at end of file
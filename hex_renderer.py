@@ -3,12 +3,73 @@ Renderer for hexagonal grids in RedRumRunner.
 Handles converting between hex coordinates and screen coordinates for rendering.
 """
 import math
+from functools import lru_cache
 from typing import Dict, Tuple, List
 
 from tcod.console import Console
 import numpy as np
 
-from src.engine.hex_grid import HexCoord, HexGrid, HexOrientation, HexCell
+from src.engine.hex_grid import HexCoord, HexGrid, HexOrientation
+
+# Smallest hex size with room for a coordinate label; smaller hexes show
+# their terrain character instead
+MIN_TEXT_HEX_SIZE = 3.0
+
+
+@lru_cache(maxsize=4096)
+def _coord_label(x: int, z: int) -> str:
+    """Coordinate label for a hex, cached as the same hexes are drawn every frame."""
+    return f"{x},{z}"
+
+
+def _line_points(x1: int, y1: int, x2: int, y2: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the points of a line between two points, using Bresenham's line algorithm.
+    
+    Args:
+        x1, y1: Starting point coordinates
+        x2, y2: Ending point coordinates
+        
+    Returns:
+        A tuple of (xs, ys) integer arrays, from the start to the end point
+    """
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    
+    # One point per step along the major axis; the minor axis offset is
+    # the Bresenham rounding of the exact slope, ties rounding down
+    steps = np.arange(max(dx, dy) + 1)
+    if dx >= dy:
+        xs = x1 + sx * steps
+        ys = y1 + sy * ((2 * steps * dy + max(dx - 1, 0)) // max(2 * dx, 1))
+    else:
+        xs = x1 + sx * ((2 * steps * dx + dy - 1) // (2 * dy))
+        ys = y1 + sy * steps
+    
+    return xs, ys
+
+
+def _outline_points(corners: List[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the points of a closed outline through integer corners.
+    
+    Args:
+        corners: The (x, y) corner pixels, in drawing order
+        
+    Returns:
+        A tuple of (xs, ys) integer arrays of the points on every edge
+    """
+    # Connect each corner to the next
+    edges = [
+        _line_points(*corners[i], *corners[(i + 1) % len(corners)])
+        for i in range(len(corners))
+    ]
+    return (
+        np.concatenate([xs for xs, _ in edges]),
+        np.concatenate([ys for _, ys in edges])
+    )
 
 
 class HexRenderer:
@@ -41,6 +102,29 @@ class HexRenderer:
         
         # Default to blue for any undefined terrain types
         self.default_colors = ((150, 150, 255), (0, 0, 100))
+        
+        # Characters representing each terrain type
+        self.terrain_chars = {
+            "ocean": '~',
+            "land": '.',
+            "mountain": '^',
+            "forest": 'f',
+            "desert": 'd',
+            "river": '~',
+            "reef": '*',
+            "port": 'P'
+        }
+        self.default_char = '.'
+        
+        # Per-terrain-id lookup tables for the grid's terrain names in
+        # _lut_names: (colors list, fg array, bg array, char array)
+        self._lut_names = None
+        self._luts = None
+        
+        # Outline pixels per hex as (xs, ys) arrays, valid for the (origin,
+        # size, orientation) in _outline_key
+        self._outline_cache: Dict[HexCoord, Tuple[np.ndarray, np.ndarray]] = {}
+        self._outline_key = None
     
     def set_selected_hex(self, coord: HexCoord) -> None:
         """
@@ -62,12 +146,7 @@ class HexRenderer:
         Returns:
             The HexCoord at the pixel location
         """
-        return HexCoord.from_pixel(
-            x, y, 
-            self.grid.orientation, 
-            self.grid.hex_size, 
-            self.grid.origin
-        )
+        return self.grid.pixel_to_hex(x, y)
     
     def render(self, console: Console, camera_offset: Tuple[int, int] = (0, 0)) -> None:
         """
@@ -83,43 +162,75 @@ class HexRenderer:
             self.grid.origin[1] - camera_offset[1]
         )
         
+        # Cached outlines are only valid for the same layout
+        outline_key = (adjusted_origin, self.grid.hex_size, self.grid.orientation)
+        if outline_key != self._outline_key:
+            self._outline_cache.clear()
+            self._outline_key = outline_key
+        
         # Calculate the visible area in hex coordinates
         # This is an approximation that ensures we render all visible hexes
-        top_left = HexCoord.from_pixel(
-            0, 0, 
-            self.grid.orientation, 
-            self.grid.hex_size, 
-            adjusted_origin
-        )
-        bottom_right = HexCoord.from_pixel(
-            console.width, console.height, 
-            self.grid.orientation, 
-            self.grid.hex_size, 
-            adjusted_origin
-        )
+        top_left = self.grid.pixel_to_hex(0, 0, adjusted_origin)
+        bottom_right = self.grid.pixel_to_hex(console.width, console.height, adjusted_origin)
         
         # Add a buffer to ensure we render hexes that might be partially visible
         buffer = 2
-        visible_area = []
         
-        for x in range(top_left.x - buffer, bottom_right.x + buffer + 1):
-            for y in range(top_left.y - buffer, bottom_right.y + buffer + 1):
-                for z in range(top_left.z - buffer, bottom_right.z + buffer + 1):
-                    # Skip invalid cube coordinates
-                    if x + y + z != 0:
-                        continue
-                    
-                    coord = HexCoord(x, y, z)
-                    visible_area.append(coord)
+        # Enumerate (x, y) pairs and derive z, keeping those in the z range
+        xs, ys = np.meshgrid(
+            np.arange(top_left.x - buffer, bottom_right.x + buffer + 1, dtype=np.int64),
+            np.arange(top_left.y - buffer, bottom_right.y + buffer + 1, dtype=np.int64),
+            indexing='ij'
+        )
+        xs = xs.ravel()
+        ys = ys.ravel()
+        zs = -xs - ys
+        keep = (zs >= top_left.z - buffer) & (zs <= bottom_right.z + buffer)
+        
+        # Keep only hexes that are in the grid
+        rows = self.grid.lookup_rows(xs, zs)
+        keep &= rows >= 0
+        coords = np.stack([xs[keep], ys[keep], zs[keep]], axis=1)
+        rows = rows[keep]
+        
+        # Hexes are drawn when their center is on screen
+        centers = HexCoord.to_pixel_batch(
+            coords, self.grid.orientation, self.grid.hex_size, adjusted_origin
+        )
+        on_screen = ((centers[:, 0] >= 0) & (centers[:, 0] < console.width) &
+                     (centers[:, 1] >= 0) & (centers[:, 1] < console.height))
+        coords = coords[on_screen]
+        center_xs = centers[on_screen, 0].astype(np.int64)
+        center_ys = centers[on_screen, 1].astype(np.int64)
+        terrain_ids = self.grid.terrain_ids()[rows[on_screen]]
         
-        # Render all visible hexes
-        for coord in visible_area:
-            cell = self.grid.get_cell(coord)
-            if cell:
-                self._render_hex(console, coord, cell, adjusted_origin)
+        # Fill the center cell of every hex with its terrain in one write each;
+        # the terrain character is left showing only when labels are off
+        show_labels = self.grid.hex_size >= MIN_TEXT_HEX_SIZE
+        colors, fg_lut, bg_lut, char_lut = self._terrain_luts()
+        console.bg[center_ys, center_xs] = bg_lut[terrain_ids]
+        console.fg[center_ys, center_xs] = fg_lut[terrain_ids]
+        console.ch[center_ys, center_xs] = char_lut[terrain_ids]
+        
+        # Compute the outlines not cached yet from one batch of corners
+        hexes = [HexCoord.raw(x, y, z) for x, y, z in coords.tolist()]
+        missing = [i for i, coord in enumerate(hexes) if coord not in self._outline_cache]
+        if missing:
+            corners = HexCoord.corners_pixel_array(
+                coords[missing], self.grid.orientation, self.grid.hex_size, adjusted_origin
+            ).astype(np.int64)
+            for i, hex_corners in zip(missing, corners.tolist()):
+                self._outline_cache[hexes[i]] = _outline_points(hex_corners)
+        
+        # Render outlines and labels of all visible hexes
+        for coord, center_x, center_y, terrain_id in zip(
+                hexes, center_xs.tolist(), center_ys.tolist(), terrain_ids.tolist()):
+            fg_color, bg_color = colors[terrain_id]
+            self._render_hex(console, coord, center_x, center_y,
+                             fg_color, bg_color, adjusted_origin, show_labels)
         
         # Render the selected hex highlight
-        if self.selected_hex and self.grid.get_cell(self.selected_hex):
+        if self.selected_hex and self.grid.is_in_bounds(self.selected_hex):
             self._render_hex_outline(
                 console, 
                 self.selected_hex, 
@@ -127,75 +238,52 @@ class HexRenderer:
                 adjusted_origin
             )
     
-    def _render_hex(self, console: Console, coord: HexCoord, 
-                   cell: HexCell, origin: Tuple[float, float]) -> None:
+    def _terrain_luts(self) -> Tuple[List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]],
+                                      np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get color and character lookup tables indexed by the grid's terrain ids.
+        
+        Returns:
+            A tuple of the (foreground, background) color list, and the
+            foreground, background and character arrays
+        """
+        names = self.grid.terrain_names
+        if names != self._lut_names:
+            colors = [self.terrain_colors.get(name, self.default_colors) for name in names]
+            chars = [ord(self.terrain_chars.get(name, self.default_char)) for name in names]
+            self._luts = (
+                colors,
+                np.array([fg for fg, _ in colors], dtype=np.uint8).reshape(-1, 3),
+                np.array([bg for _, bg in colors], dtype=np.uint8).reshape(-1, 3),
+                np.array(chars, dtype=np.int32)
+            )
+            self._lut_names = names
+        
+        return self._luts
+    
+    def _render_hex(self, console: Console, coord: HexCoord, center_x: int, center_y: int,
+                    fg_color: Tuple[int, int, int], bg_color: Tuple[int, int, int],
+                    origin: Tuple[float, float], show_label: bool = True) -> None:
         """
-        Render a single hex to the console.
+        Render the outline and label of a hex whose center is on screen.
         
         Args:
             console: The tcod Console to render to
             coord: The hex coordinates
-            cell: The hex cell data
+            center_x, center_y: Integer center of the hex on the console
+            fg_color: RGB foreground color for the terrain
+            bg_color: RGB background color for the terrain
             origin: Adjusted origin for camera position
+            show_label: Whether to draw the coordinate text
         """
-        # Get hex center in pixel coordinates
-        center = coord.to_pixel(
-            self.grid.orientation, 
-            self.grid.hex_size, 
-            origin
-        )
+        # Draw the hex outline
+        self._render_hex_outline(console, coord, fg_color, origin)
         
-        # Get corners in pixel coordinates
-        corners = coord.get_all_corners_pixel(
-            self.grid.orientation, 
-            self.grid.hex_size, 
-            origin
-        )
-        
-        # Check if the hex is on screen
-        if (0 <= center[0] < console.width and 
-            0 <= center[1] < console.height):
-            
-            # Get colors for this terrain type
-            colors = self.terrain_colors.get(
-                cell.terrain_type, 
-                self.default_colors
-            )
-            
-            # Convert center to integer coordinates
-            center_x, center_y = int(center[0]), int(center[1])
-            
-            # Draw basic character and background for the hex
-            bg_color = colors[1]
-            fg_color = colors[0]
-            
-            # Set the background color for this cell
-            if 0 <= center_x < console.width and 0 <= center_y < console.height:
-                console.bg[center_y, center_x] = bg_color
-                console.fg[center_y, center_x] = fg_color
-                
-                # Print a character representing the terrain
-                terrain_chars = {
-                    "ocean": '~',
-                    "land": '.',
-                    "mountain": '^',
-                    "forest": 'f',
-                    "desert": 'd',
-                    "river": '~',
-                    "reef": '*',
-                    "port": 'P'
-                }
-                char = terrain_chars.get(cell.terrain_type, '.')
-                console.print(center_x, center_y, char, fg=fg_color, bg=bg_color)
-            
-            # Draw the hex outline
-            self._render_hex_outline(console, coord, fg_color, origin)
-            
-            # Draw coordinate text in the center
-            text = f"{coord.x},{coord.z}"
+        # Draw coordinate text in the center
+        if show_label:
             console.print(
                 center_x, center_y,
-                text,
+                _coord_label(coord.x, coord.z),
                 fg=fg_color,
                 bg=bg_color
             )
@@ -212,54 +300,36 @@ class HexRenderer:
             color: RGB color tuple for the outline
             origin: Adjusted origin for camera position
         """
-        corners = coord.get_all_corners_pixel(
-            self.grid.orientation, 
-            self.grid.hex_size, 
-            origin
-        )
-        
-        # Convert to integer coordinates
-        int_corners = [(int(x), int(y)) for x, y in corners]
+        xs, ys = self._hex_outline(coord, origin)
         
-        # Draw the outline by connecting each corner to the next
-        for i in range(len(int_corners)):
-            j = (i + 1) % len(int_corners)
-            self._draw_line(console, 
-                         int_corners[i][0], int_corners[i][1],
-                         int_corners[j][0], int_corners[j][1],
-                         color)
+        # Draw all six edges with one write, clipped to the console
+        on_screen = (xs >= 0) & (xs < console.width) & (ys >= 0) & (ys < console.height)
+        xs = xs[on_screen]
+        ys = ys[on_screen]
+        console.fg[ys, xs] = color
+        console.ch[ys, xs] = ord('.')  # Using a simple ASCII dot for the line
     
-    def _draw_line(self, console: Console, x1: int, y1: int, x2: int, y2: int, color: Tuple[int, int, int]) -> None:
+    def _hex_outline(self, coord: HexCoord, origin: Tuple[float, float]) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Draw a line between two points.
-        Using Bresenham's line algorithm.
+        Get the outline pixels of a hex, computing them once per layout.
         
         Args:
-            console: The console to draw on
-            x1, y1: Starting point coordinates
-            x2, y2: Ending point coordinates
-            color: RGB color tuple
+            coord: The hex coordinates
+            origin: Adjusted origin for camera position
+            
+        Returns:
+            A tuple of (xs, ys) integer arrays of the pixels on the six edges
         """
-        # Bresenham's line algorithm
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        sx = 1 if x1 < x2 else -1
-        sy = 1 if y1 < y2 else -1
-        err = dx - dy
-        
-        while True:
-            # Draw the point if it's within the console bounds
-            if 0 <= x1 < console.width and 0 <= y1 < console.height:
-                console.fg[y1, x1] = color
-                console.ch[y1, x1] = ord('.')  # Using a simple ASCII dot for the line
+        outline = self._outline_cache.get(coord)
+        if outline is None:
+            corners = coord.get_all_corners_pixel(
+                self.grid.orientation, 
+                self.grid.hex_size, 
+                origin
+            )
             
-            if x1 == x2 and y1 == y2:
-                break
-                
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x1 += sx
-            if e2 < dx:
-                err += dx
-                y1 += sy
\ No newline at end of file
+            # Convert to integer coordinates
+            outline = _outline_points([(int(x), int(y)) for x, y in corners])
+            self._outline_cache[coord] = outline
+        
+        return outline
\ No newline at end of file
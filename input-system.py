@@ -4,7 +4,9 @@ Enhanced input handling system for RedRumRunner.
 Processes input events and converts them to game actions with customizable mapping.
 """
 import tcod.event
+from collections import ChainMap
 from enum import Enum, auto
+from types import MappingProxyType
 
 class InputMode(Enum):
     """Enum representing different input modes for context-sensitive controls."""
@@ -43,11 +45,39 @@ class GameAction(Enum):
     HELP = auto()
     DEBUG = auto()
 
+# Direction reported with movement and rotation actions
+_DIRECTION_MAP = {
+    GameAction.MOVE_UP: "up",
+    GameAction.MOVE_DOWN: "down",
+    GameAction.MOVE_LEFT: "left",
+    GameAction.MOVE_RIGHT: "right",
+    GameAction.MOVE_UP_LEFT: "up_left",
+    GameAction.MOVE_UP_RIGHT: "up_right",
+    GameAction.MOVE_DOWN_LEFT: "down_left",
+    GameAction.MOVE_DOWN_RIGHT: "down_right",
+    GameAction.ROTATE_CLOCKWISE: "clockwise",
+    GameAction.ROTATE_COUNTERCLOCKWISE: "counterclockwise"
+}
+
+# Shared read-only action results; movement and rotation results include
+# their direction
+_ACTION_RESULTS = {action: MappingProxyType({"action": action}) for action in GameAction}
+_NONE_RESULT = _ACTION_RESULTS[GameAction.NONE]
+_DIRECTION_RESULTS = {
+    action: MappingProxyType({"action": action, "direction": direction})
+    for action, direction in _DIRECTION_MAP.items()
+}
+
 class InputHandler:
     """
     Handles input events and maps them to game actions.
     Supports different input modes for context-sensitive controls.
     """
+    __slots__ = (
+        'current_mode', 'text_input_buffer', 'text_input_callback', 'key_mappings',
+        'mouse_position', 'mouse_button_state', '_mode_lookup', '_active_lookup',
+        '_event_handlers'
+    )
     
     def __init__(self):
         """Initialize the input handler with default key mappings."""
@@ -57,6 +87,7 @@ class InputHandler:
         
         # Define key mappings for different modes
         self.key_mappings = self._create_default_key_mappings()
+        self._build_key_lookup()
         
         # Mouse state
         self.mouse_position = (0, 0)
@@ -65,6 +96,15 @@ class InputHandler:
             tcod.event.BUTTON_RIGHT: False,
             tcod.event.BUTTON_MIDDLE: False
         }
+        
+        # Event handlers by event class
+        self._event_handlers = {
+            tcod.event.Quit: self._handle_quit,
+            tcod.event.KeyDown: self._handle_key,
+            tcod.event.MouseMotion: self._handle_mouse_motion,
+            tcod.event.MouseButtonDown: self._handle_mouse_down,
+            tcod.event.MouseButtonUp: self._handle_mouse_up
+        }
     
     def _create_default_key_mappings(self):
         """Create the default key mappings for different input modes."""
@@ -123,16 +163,14 @@ class InputHandler:
         mappings[InputMode.MENU] = menu_mode
         
         # World map mode (extends normal mode with map-specific controls)
-        world_map_mode = normal_mode.copy()
-        world_map_mode.update({
+        world_map_mode = ChainMap({
             tcod.event.K_q: GameAction.ROTATE_COUNTERCLOCKWISE,
             tcod.event.K_e: GameAction.ROTATE_CLOCKWISE,
-        })
+        }, normal_mode)
         mappings[InputMode.WORLD_MAP] = world_map_mode
         
         # Tactical mode (similar to world map but may have combat-specific controls)
-        tactical_mode = world_map_mode.copy()
-        tactical_mode.update({
+        tactical_mode = world_map_mode.new_child({
             tcod.event.K_TAB: GameAction.WAIT,  # End turn in tactical mode
         })
         mappings[InputMode.TACTICAL] = tactical_mode
@@ -156,6 +194,21 @@ class InputHandler:
         
         return mappings
     
+    def _build_key_lookup(self):
+        """
+        Flatten key_mappings into per-mode lookups of each key's shared result.
+        
+        Must be called again after key_mappings is changed.
+        """
+        self._mode_lookup = {
+            mode: {
+                key: _DIRECTION_RESULTS.get(action) or _ACTION_RESULTS[action]
+                for key, action in mapping.items()
+            }
+            for mode, mapping in self.key_mappings.items()
+        }
+        self._active_lookup = self._mode_lookup.get(self.current_mode, {})
+    
     def set_mode(self, mode):
         """
         Set the current input mode.
@@ -164,6 +217,7 @@ class InputHandler:
             mode: The InputMode to set
         """
         self.current_mode = mode
+        self._active_lookup = self._mode_lookup.get(mode, {})
         
         # Reset text input state if we're entering text input mode
         if mode == InputMode.TEXT_INPUT:
@@ -189,40 +243,41 @@ class InputHandler:
             event: A tcod event to process
             
         Returns:
-            A dict with action information or None if the event doesn't map to an action
+            A dict with action information or None if the event doesn't map to an action.
+            Results for key and quit actions are shared and read-only.
         """
-        # Handle window close event
-        if event.type == tcod.event.QUIT:
-            return {"action": GameAction.QUIT}
-        
-        # Handle key events
-        elif event.type == tcod.event.KEYDOWN:
-            return self._handle_key(event)
-        
-        # Handle mouse movement
-        elif event.type == tcod.event.MOUSEMOTION:
-            self.mouse_position = (event.tile.x, event.tile.y)
-            return {"action": GameAction.NONE, "mouse_position": self.mouse_position}
-        
-        # Handle mouse button press
-        elif event.type == tcod.event.MOUSEBUTTONDOWN:
-            self.mouse_button_state[event.button] = True
-            return {
-                "action": GameAction.SELECT,
-                "button": event.button,
-                "position": (event.tile.x, event.tile.y)
-            }
-        
-        # Handle mouse button release
-        elif event.type == tcod.event.MOUSEBUTTONUP:
-            self.mouse_button_state[event.button] = False
-            return {
-                "action": GameAction.NONE,
-                "button": event.button,
-                "position": (event.tile.x, event.tile.y)
-            }
-        
-        return None
+        handler = self._event_handlers.get(type(event))
+        return handler(event) if handler else None
+    
+    def _handle_quit(self, event):
+        """Map a window close event to the quit action."""
+        return _ACTION_RESULTS[GameAction.QUIT]
+    
+    def _handle_mouse_motion(self, event):
+        """Track the mouse tile position, ignoring motion within the same tile."""
+        position = (event.tile.x, event.tile.y)
+        if position == self.mouse_position:
+            return None
+        self.mouse_position = position
+        return {"action": GameAction.NONE, "mouse_position": position}
+    
+    def _handle_mouse_down(self, event):
+        """Record a mouse button press and map it to selection."""
+        self.mouse_button_state[event.button] = True
+        return {
+            "action": GameAction.SELECT,
+            "button": event.button,
+            "position": (event.tile.x, event.tile.y)
+        }
+    
+    def _handle_mouse_up(self, event):
+        """Record a mouse button release."""
+        self.mouse_button_state[event.button] = False
+        return {
+            "action": GameAction.NONE,
+            "button": event.button,
+            "position": (event.tile.x, event.tile.y)
+        }
     
     def _handle_key(self, event):
         """
@@ -259,7 +314,7 @@ class InputHandler:
             elif key == tcod.event.K_ESCAPE:
                 # Cancel text input
                 self.set_mode(InputMode.NORMAL)
-                return {"action": GameAction.CANCEL}
+                return _ACTION_RESULTS[GameAction.CANCEL]
             elif key == tcod.event.K_TAB:
                 # Tab key (could be used for autocomplete)
                 return {
@@ -284,45 +339,8 @@ class InputHandler:
                     "text_buffer": self.text_input_buffer
                 }
         
-        # Look up the key in the current mode's mapping
-        current_mapping = self.key_mappings.get(self.current_mode, {})
-        
-        # Check for mapped action
-        if key in current_mapping:
-            action = current_mapping[key]
-            
-            # For movement actions, include the direction
-            if action in (
-                GameAction.MOVE_UP, GameAction.MOVE_DOWN,
-                GameAction.MOVE_LEFT, GameAction.MOVE_RIGHT,
-                GameAction.MOVE_UP_LEFT, GameAction.MOVE_UP_RIGHT,
-                GameAction.MOVE_DOWN_LEFT, GameAction.MOVE_DOWN_RIGHT
-            ):
-                direction_map = {
-                    GameAction.MOVE_UP: "up",
-                    GameAction.MOVE_DOWN: "down",
-                    GameAction.MOVE_LEFT: "left",
-                    GameAction.MOVE_RIGHT: "right",
-                    GameAction.MOVE_UP_LEFT: "up_left",
-                    GameAction.MOVE_UP_RIGHT: "up_right",
-                    GameAction.MOVE_DOWN_LEFT: "down_left",
-                    GameAction.MOVE_DOWN_RIGHT: "down_right"
-                }
-                direction = direction_map.get(action)
-                return {"action": action, "direction": direction}
-            
-            # For rotation actions, include the direction
-            elif action in (GameAction.ROTATE_CLOCKWISE, GameAction.ROTATE_COUNTERCLOCKWISE):
-                return {
-                    "action": action,
-                    "direction": "clockwise" if action == GameAction.ROTATE_CLOCKWISE else "counterclockwise"
-                }
-            
-            # For other actions, just return the action
-            return {"action": action}
-        
-        # No mapping found
-        return {"action": GameAction.NONE}
+        # Look up the key's result in the current mode's mapping
+        return self._active_lookup.get(key, _NONE_RESULT)
     
     def get_mouse_position(self):
         """
@@ -331,4 +349,4 @@ class InputHandler:
         Returns:
             Tuple of (x, y) coordinates
         """
-        return self.mouse
\ No newline at end of file
+        return self.mouse_position
\ No newline at end of file
@@ -1,11 +1,18 @@
 import tcod
 import tcod.event as event
+import types
 from src.states.state import State
 
+# Menu item colors
+_SELECTED_FG = (255, 255, 255)
+_UNSELECTED_FG = (150, 150, 150)
+
 class MainMenuState(State):
     """
     Main menu state.
     """
+    __slots__ = ('menu_items', 'selected_item', '_layout_cache')
+    
     def __init__(self, game_state):
         super().__init__(game_state)
         self.menu_items = [
@@ -15,6 +22,7 @@ class MainMenuState(State):
             "Quit"
         ]
         self.selected_item = 0
+        self._layout_cache = None  # Screen geometry, built on first render
     
     def enter(self):
         super().enter()
@@ -29,6 +37,10 @@ class MainMenuState(State):
         pass
     
     def render(self, console):
+        layout = self._layout_cache
+        if layout is None or layout.width != console.width or layout.height != console.height:
+            layout = self._build_layout(console)
+        
         # Clear console
         console.clear()
         
@@ -37,8 +49,8 @@ class MainMenuState(State):
         version = f"v{self.game_state.game_version}"
         
         console.print(
-            console.width // 2,
-            console.height // 4,
+            layout.center_x,
+            layout.title_y,
             title,
             fg=(255, 0, 0),
             bg=None,
@@ -46,8 +58,8 @@ class MainMenuState(State):
         )
         
         console.print(
-            console.width // 2,
-            console.height // 4 + 2,
+            layout.center_x,
+            layout.title_y + 2,
             version,
             fg=(200, 200, 200),
             bg=None,
@@ -56,10 +68,10 @@ class MainMenuState(State):
         
         # Draw menu items
         for i, item in enumerate(self.menu_items):
-            fg = (255, 255, 255) if i == self.selected_item else (150, 150, 150)
+            fg = _SELECTED_FG if i == self.selected_item else _UNSELECTED_FG
             console.print(
-                console.width // 2,
-                console.height // 2 + i * 2,
+                layout.center_x,
+                layout.item_ys[i],
                 item,
                 fg=fg,
                 bg=None,
@@ -68,14 +80,35 @@ class MainMenuState(State):
         
         # Draw footer
         console.print(
-            console.width // 2,
-            console.height - 3,
+            layout.center_x,
+            layout.footer_y,
             "Up/Down: Select | Enter: Confirm | Esc: Quit",
             fg=(150, 150, 150),
             bg=None,
             alignment=tcod.CENTER
         )
     
+    def _build_layout(self, console):
+        """
+        Precompute the screen geometry for a console size.
+        
+        Args:
+            console (Console): tcod console being rendered to.
+            
+        Returns:
+            SimpleNamespace: The cached layout.
+        """
+        top = console.height // 2
+        self._layout_cache = types.SimpleNamespace(
+            width=console.width,
+            height=console.height,
+            center_x=console.width // 2,
+            title_y=console.height // 4,
+            footer_y=console.height - 3,
+            item_ys=[top + i * 2 for i in range(len(self.menu_items))]
+        )
+        return self._layout_cache
+    
     def handle_event(self, evt):
         # Process input
         if isinstance(evt, event.KeyDown):
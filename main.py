@@ -16,7 +16,7 @@ from src.states.fleet_management_state import FleetManagementState
 from src.states.combat_state import CombatState
 from src.utils.error_handler import ErrorHandler
 from src.utils.state_validator import StateValidator
-from src.config import Config
+from src.config import CONFIG
 
 def setup_logging():
     """Setup logging configuration."""
@@ -52,23 +52,23 @@ def main():
     # Set up the font
     try:
         tcod.console_set_custom_font(
-            Config.FONT_PATH,
-            Config.FONT_FLAGS
+            CONFIG.FONT_PATH,
+            CONFIG.FONT_FLAGS
         )
     except Exception as e:
         logger.error(f"Error loading font: {e}")
         logger.info("Using default font")
     
     # Create a context (window)
-    width = Config.SCREEN_WIDTH
-    height = Config.SCREEN_HEIGHT
+    width = CONFIG.SCREEN_WIDTH
+    height = CONFIG.SCREEN_HEIGHT
     
     try:
         with tcod.context.new_terminal(
             width,
             height,
             tileset=None,
-            title=Config.WINDOW_TITLE,
+            title=CONFIG.WINDOW_TITLE,
             vsync=True
         ) as context:
             # Create main console for rendering
@@ -102,21 +102,27 @@ def main():
             # Set initial state
             state_machine.set_state("main_menu")
             
-            # Game loop
-            previous_time = time.time()
+            # Game loop; input is polled rather than waited for, so each frame
+            # sleeps off what is left of its CONFIG.FPS_LIMIT time slice (vsync
+            # alone does not pace the loop on every renderer)
+            previous_ns = time.perf_counter_ns()
+            poll_budget_ns = int(CONFIG.EVENT_POLL_BUDGET * 1e9)
+            frame_ns = 1_000_000_000 // CONFIG.FPS_LIMIT
             running = True
             
             while running:
                 # Calculate delta time
-                current_time = time.time()
-                delta_time = current_time - previous_time
-                previous_time = current_time
+                current_ns = time.perf_counter_ns()
+                delta_time = (current_ns - previous_ns) * 1e-9
+                previous_ns = current_ns
                 
                 # Limit delta time to prevent huge jumps
                 delta_time = min(delta_time, 0.1)
                 
-                # Process input
-                for evt in tcod.event.wait():
+                # Process pending input, leaving events past the time budget
+                # queued for the next frame
+                poll_deadline = current_ns + poll_budget_ns
+                for evt in tcod.event.get():
                     # Exit check
                     if isinstance(evt, tcod.event.Quit):
                         running = False
@@ -124,12 +130,14 @@ def main():
                     
                     # Forward events to state machine for handling
                     try:
-                        if state_machine.handle_event(evt):
-                            continue
+                        state_machine.handle_event(evt)
                     except SystemExit:
                         running = False
                         break
                     
+                    if time.perf_counter_ns() > poll_deadline:
+                        break
+                    
                 if not running:
                     break
                 
@@ -140,6 +148,11 @@ def main():
                 console.clear()
                 state_machine.render(console)
                 context.present(console)
+                
+                # Cap the frame rate
+                remaining_ns = current_ns + frame_ns - time.perf_counter_ns()
+                if remaining_ns > 0:
+                    time.sleep(remaining_ns * 1e-9)
         
     except Exception as e:
         logger.critical(f"Fatal error: {e}")
@@ -1,16 +1,50 @@
 import tcod
 import tcod.event as event
+import types
 from src.states.state import State
 
 class PortInterfaceState(State):
     """
     Port interface state - for trading and port interactions.
     """
+    __slots__ = (
+        'port_name', 'selected_tab', 'tabs', '_layout_cache', '_resources_key',
+        '_resources_text'
+    )
+    
+    # Placeholder port inventory: (name, price in gold, units available)
+    _GOODS = (
+        ("Food", 10, 100),
+        ("Water", 5, 200),
+        ("Rum", 20, 50),
+        ("Ammunition", 15, 30)
+    )
+    
+    # Placeholder shipyard stock: (name, price in gold, speed, cargo)
+    _SHIPS = (
+        ("Sloop", 1000, "Fast", "Small"),
+        ("Brigantine", 2500, "Medium", "Medium"),
+        ("Galleon", 5000, "Slow", "Large")
+    )
+    
+    # Formatted tab rows: (y, name, price text, detail text)
+    _TRADE_ROWS = tuple(
+        (12 + i * 2, name, f"Price: {price} gold", f"Available: {available}")
+        for i, (name, price, available) in enumerate(_GOODS)
+    )
+    _SHIPYARD_ROWS = tuple(
+        (12 + i * 3, name, f"Price: {price} gold", f"Speed: {speed} | Cargo: {cargo}")
+        for i, (name, price, speed, cargo) in enumerate(_SHIPS)
+    )
+    
     def __init__(self, game_state):
         super().__init__(game_state)
         self.port_name = "Test Port"  # Would come from actual port data
         self.selected_tab = "Trade"
         self.tabs = ["Trade", "Shipyard", "Tavern", "Warehouse"]
+        self._layout_cache = None  # Screen geometry, built on first render
+        self._resources_key = None  # Resource amounts the cached resources text was built from
+        self._resources_text = ""
     
     def enter(self):
         super().enter()
@@ -25,12 +59,16 @@ class PortInterfaceState(State):
         pass
     
     def render(self, console):
+        layout = self._layout_cache
+        if layout is None or layout.width != console.width or layout.height != console.height:
+            layout = self._build_layout(console)
+        
         # Clear console
         console.clear()
         
         # Draw port name
         console.print(
-            console.width // 2,
+            layout.center_x,
             2,
             f"Port: {self.port_name}",
             fg=(255, 255, 0),
@@ -40,7 +78,7 @@ class PortInterfaceState(State):
         
         # Draw tabs
         for i, tab in enumerate(self.tabs):
-            x = console.width // len(self.tabs) * i + console.width // (len(self.tabs) * 2)
+            x = layout.tab_positions[i]
             y = 5
             fg = (255, 255, 255) if tab == self.selected_tab else (150, 150, 150)
             
@@ -63,15 +101,19 @@ class PortInterfaceState(State):
         elif self.selected_tab == "Warehouse":
             self._render_warehouse_tab(console)
         
-        # Draw resources
-        resources_text = "Your Resources: "
-        for resource, amount in self.game_state.player_resources.items():
-            resources_text += f"{resource}: {amount} | "
+        # Draw resources, formatted again only when an amount changes
+        resources = self.game_state.player_resources
+        key = resources.amounts.tobytes()
+        if key != self._resources_key:
+            self._resources_text = "Your Resources: " + " | ".join(
+                f"{resource}: {amount}" for resource, amount in resources.items()
+            )
+            self._resources_key = key
         
         console.print(
-            console.width // 2,
-            console.height - 5,
-            resources_text[:-3],  # Remove last " | "
+            layout.center_x,
+            layout.resources_y,
+            self._resources_text,
             fg=(100, 200, 100),
             bg=None,
             alignment=tcod.CENTER
@@ -79,18 +121,45 @@ class PortInterfaceState(State):
         
         # Draw available commands
         console.print(
-            console.width // 2,
-            console.height - 3,
+            layout.center_x,
+            layout.footer_y,
             "Tab: Switch Tab | W: World Map | Esc: Back",
             fg=(150, 150, 150),
             bg=None,
             alignment=tcod.CENTER
         )
     
+    def _build_layout(self, console):
+        """
+        Precompute the screen geometry for a console size.
+        
+        Args:
+            console (Console): tcod console being rendered to.
+            
+        Returns:
+            SimpleNamespace: The cached layout.
+        """
+        width = console.width
+        tab_width = width // len(self.tabs)
+        half_tab = width // (len(self.tabs) * 2)
+        
+        self._layout_cache = types.SimpleNamespace(
+            width=width,
+            height=console.height,
+            quarter_x=width // 4,
+            center_x=width // 2,
+            three_quarter_x=3 * width // 4,
+            tab_positions=[tab_width * i + half_tab for i in range(len(self.tabs))],
+            resources_y=console.height - 5,
+            footer_y=console.height - 3
+        )
+        return self._layout_cache
+    
     def _render_trade_tab(self, console):
         """Render the trade tab content."""
+        layout = self._layout_cache
         console.print(
-            console.width // 2,
+            layout.center_x,
             10,
             "Available Goods for Trade",
             fg=(200, 200, 200),
@@ -98,44 +167,16 @@ class PortInterfaceState(State):
             alignment=tcod.CENTER
         )
         
-        # List of goods (would be actual port inventory)
-        goods = [
-            {"name": "Food", "price": 10, "available": 100},
-            {"name": "Water", "price": 5, "available": 200},
-            {"name": "Rum", "price": 20, "available": 50},
-            {"name": "Ammunition", "price": 15, "available": 30},
-        ]
-        
-        for i, good in enumerate(goods):
-            y = 12 + i * 2
-            console.print(
-                console.width // 4,
-                y,
-                good["name"],
-                fg=(255, 255, 255),
-                bg=None
-            )
-            
-            console.print(
-                console.width // 2,
-                y,
-                f"Price: {good['price']} gold",
-                fg=(255, 255, 0),
-                bg=None
-            )
-            
-            console.print(
-                3 * console.width // 4,
-                y,
-                f"Available: {good['available']}",
-                fg=(150, 150, 150),
-                bg=None
-            )
+        for y, name, price_text, available_text in PortInterfaceState._TRADE_ROWS:
+            console.print(layout.quarter_x, y, name, fg=(255, 255, 255), bg=None)
+            console.print(layout.center_x, y, price_text, fg=(255, 255, 0), bg=None)
+            console.print(layout.three_quarter_x, y, available_text, fg=(150, 150, 150), bg=None)
     
     def _render_shipyard_tab(self, console):
         """Render the shipyard tab content."""
+        layout = self._layout_cache
         console.print(
-            console.width // 2,
+            layout.center_x,
             10,
             "Available Ships",
             fg=(200, 200, 200),
@@ -143,43 +184,16 @@ class PortInterfaceState(State):
             alignment=tcod.CENTER
         )
         
-        # List of ships (would be actual shipyard inventory)
-        ships = [
-            {"name": "Sloop", "price": 1000, "speed": "Fast", "cargo": "Small"},
-            {"name": "Brigantine", "price": 2500, "speed": "Medium", "cargo": "Medium"},
-            {"name": "Galleon", "price": 5000, "speed": "Slow", "cargo": "Large"},
-        ]
-        
-        for i, ship in enumerate(ships):
-            y = 12 + i * 3
-            console.print(
-                console.width // 4,
-                y,
-                ship["name"],
-                fg=(255, 255, 255),
-                bg=None
-            )
-            
-            console.print(
-                console.width // 2,
-                y,
-                f"Price: {ship['price']} gold",
-                fg=(255, 255, 0),
-                bg=None
-            )
-            
-            console.print(
-                console.width // 4,
-                y + 1,
-                f"Speed: {ship['speed']} | Cargo: {ship['cargo']}",
-                fg=(150, 150, 150),
-                bg=None
-            )
+        for y, name, price_text, details_text in PortInterfaceState._SHIPYARD_ROWS:
+            console.print(layout.quarter_x, y, name, fg=(255, 255, 255), bg=None)
+            console.print(layout.center_x, y, price_text, fg=(255, 255, 0), bg=None)
+            console.print(layout.quarter_x, y + 1, details_text, fg=(150, 150, 150), bg=None)
     
     def _render_tavern_tab(self, console):
         """Render the tavern tab content."""
+        layout = self._layout_cache
         console.print(
-            console.width // 2,
+            layout.center_x,
             10,
             "Tavern - Hire Crew & Gather Rumors",
             fg=(200, 200, 200),
@@ -188,7 +202,7 @@ class PortInterfaceState(State):
         )
         
         console.print(
-            console.width // 2,
+            layout.center_x,
             15,
             "Available Crew Members",
             fg=(200, 200, 100),
@@ -197,7 +211,7 @@ class PortInterfaceState(State):
         )
         
         console.print(
-            console.width // 2,
+            layout.center_x,
             20,
             "Current Rumors",
             fg=(200, 100, 200),
@@ -206,7 +220,7 @@ class PortInterfaceState(State):
         )
         
         console.print(
-            console.width // 2,
+            layout.center_x,
             22,
             "\"There's talk of a merchant fleet heading east...\"",
             fg=(150, 150, 150),
@@ -216,8 +230,9 @@ class PortInterfaceState(State):
     
     def _render_warehouse_tab(self, console):
         """Render the warehouse tab content."""
+        layout = self._layout_cache
         console.print(
-            console.width // 2,
+            layout.center_x,
             10,
             "Warehouse - Stored Goods",
             fg=(200, 200, 200),
@@ -226,7 +241,7 @@ class PortInterfaceState(State):
         )
         
         console.print(
-            console.width // 2,
+            layout.center_x,
             15,
             "You have no goods stored at this port.",
             fg=(150, 150, 150),
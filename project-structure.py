@@ -71,6 +71,7 @@ class Config:
 # File: requirements.txt
 tcod>=13.0.0
 numpy>=1.20.0
+msgpack>=1.0.0
 pytest>=7.0.0  # For testing
 
 # File: README.md
@@ -96,6 +97,7 @@ In RedRumRunner, you play as a sea captain who starts with one ship and must bui
 - Python 3.8+
 - tcod 13.0.0+
 - numpy 1.20.0+
+- msgpack 1.0.0+
 
 ### Installation
 1. Clone the repository
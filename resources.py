@@ -0,0 +1,109 @@
+import logging
+from enum import IntEnum
+
+import numpy as np
+
+_LOG = logging.getLogger(__name__)
+
+class Resource(IntEnum):
+    """Index of each resource in Resources.amounts."""
+    GOLD = 0
+    FOOD = 1
+    WATER = 2
+    RUM = 3
+    AMMUNITION = 4
+
+# Resource names, indexed by Resource
+RESOURCE_NAMES = tuple(resource.name.lower() for resource in Resource)
+_RESOURCE_INDEX = {name: index for index, name in enumerate(RESOURCE_NAMES)}
+
+def _amount_property(resource):
+    """Build a read/write property for one resource amount."""
+    def getter(self):
+        return int(self.amounts[resource])
+    
+    def setter(self, value):
+        self.amounts[resource] = value
+    
+    return property(getter, setter)
+
+class Resources:
+    """
+    Player resource amounts, stored as a fixed-order int32 array.
+    
+    Amounts can be read by Resource index (amounts[Resource.RUM]), by
+    attribute (resources.rum) or by name like a dict (resources["rum"],
+    resources.get("rum", 0)).
+    """
+    gold = _amount_property(Resource.GOLD)
+    food = _amount_property(Resource.FOOD)
+    water = _amount_property(Resource.WATER)
+    rum = _amount_property(Resource.RUM)
+    ammunition = _amount_property(Resource.AMMUNITION)
+    
+    def __init__(self, gold=0, food=0, water=0, rum=0, ammunition=0):
+        self.amounts = np.array([gold, food, water, rum, ammunition], dtype=np.int32)
+    
+    def __getitem__(self, name):
+        return int(self.amounts[_RESOURCE_INDEX[name]])
+    
+    def __setitem__(self, name, value):
+        index = _RESOURCE_INDEX.get(name)
+        if index is None:
+            raise KeyError(f"Unknown resource: {name}")
+        self.amounts[index] = value
+    
+    def get(self, name, default=0):
+        """
+        Get a resource amount by name.
+        
+        Args:
+            name (str): Resource name, e.g. "food".
+            default: Value returned for unknown names.
+        
+        Returns:
+            int: Amount of the resource.
+        """
+        index = _RESOURCE_INDEX.get(name)
+        if index is None:
+            return default
+        return int(self.amounts[index])
+    
+    def items(self):
+        """
+        Get (name, amount) pairs in Resource order.
+        
+        Returns:
+            zip: Iterator of (str, int) pairs.
+        """
+        return zip(RESOURCE_NAMES, self.amounts.tolist())
+    
+    def to_dict(self):
+        """
+        Convert to a dictionary for serialization.
+        
+        Returns:
+            dict: Amounts keyed by resource name.
+        """
+        return dict(self.items())
+    
+    @staticmethod
+    def from_dict(data):
+        """
+        Create Resources from a dictionary.
+        
+        Names that are not in RESOURCE_NAMES are skipped with a warning.
+        
+        Args:
+            data (dict): Amounts keyed by resource name.
+        
+        Returns:
+            Resources: New Resources instance.
+        """
+        resources = Resources()
+        for name, amount in data.items():
+            if name in _RESOURCE_INDEX:
+                resources[name] = amount
+            else:
+                _LOG.warning(f"Ignoring unknown resource {name!r} (amount {amount})")
+        return resources
@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.engine.fleet import Fleet, CONDITION_DAMAGED, CONDITION_GOOD
+
+class TestFleet(unittest.TestCase):
+    """Test cases for Fleet class."""
+    
+    def test_round_trip(self):
+        """Test converting a fleet to a dictionary and back."""
+        fleet = Fleet()
+        fleet.append("The Dreadnought", "Sloop", CONDITION_GOOD, 15)
+        fleet.append("Sea Wraith", "Brigantine", "Damaged", 30)
+        
+        loaded = Fleet.from_dict(fleet.to_dict())
+        
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(loaded.to_dict(), fleet.to_dict())
+        self.assertEqual(loaded.names, ["The Dreadnought", "Sea Wraith"])
+        self.assertEqual(loaded.conditions[1], CONDITION_DAMAGED)
+        self.assertEqual(loaded.condition_name(1), "Damaged")
+        self.assertEqual(loaded.crew.tolist(), [15, 30])
+    
+    def test_empty_round_trip(self):
+        """Test that an empty fleet stays empty."""
+        loaded = Fleet.from_dict(Fleet().to_dict())
+        
+        self.assertEqual(len(loaded), 0)
+        self.assertFalse(loaded)
+
+if __name__ == "__main__":
+    unittest.main()
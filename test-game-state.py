@@ -92,7 +92,7 @@ class TestGameState(unittest.TestCase):
         modified_state.authority_awareness = 0.75
         
         # Save the modified version, creating a backup
-        modified_state.save_game("test_backup")
+        modified_state.save_game("test_backup", backup=True)
         
         # Corrupt the save file to trigger backup restoration
         save_path = os.path.join(os.getcwd(), 'saves', 'test_backup.save')
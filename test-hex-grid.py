@@ -0,0 +1,47 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.engine.hex_grid import HexGrid, HexCell, HexCoord
+
+class TestFindPath(unittest.TestCase):
+    """Test cases for HexGrid.find_path."""
+    
+    def setUp(self):
+        """Set up a radius-5 grid of cheap hexes."""
+        self.grid = HexGrid()
+        self.grid.create_hexagon(5)
+        for coord in self.grid.get_all_coords():
+            self.grid.set_cell(coord, HexCell("ocean", 0.5))
+        self.start = HexCoord(0, 0, 0)
+        self.goal = HexCoord(4, -4, 0)
+    
+    def _path_cost(self, path):
+        """Total movement cost of a path, not counting the start hex."""
+        return sum(self.grid.get_cell(coord).movement_cost for coord in path[1:])
+    
+    def test_unbounded_path(self):
+        """Test finding a path without a cost limit."""
+        path = self.grid.find_path(self.start, self.goal)
+        
+        self.assertEqual(path[0], self.start)
+        self.assertEqual(path[-1], self.goal)
+        self.assertEqual(self._path_cost(path), 2.0)
+    
+    def test_max_cost_reachable(self):
+        """Test that a goal within max_cost is found, even with hexes cheaper than 1."""
+        for max_cost in (2.0, 3.9):
+            path = self.grid.find_path(self.start, self.goal, max_cost)
+            self.assertEqual(path[-1], self.goal)
+            self.assertEqual(self._path_cost(path), 2.0)
+    
+    def test_max_cost_unreachable(self):
+        """Test that a goal beyond max_cost gives an empty path."""
+        self.assertEqual(self.grid.find_path(self.start, self.goal, 1.9), [])
+        self.assertEqual(self.grid.find_path(self.start, self.start, -1.0), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.engine.hex_renderer import _line_points
+
+class TestLinePoints(unittest.TestCase):
+    """Test cases for the renderer's Bresenham line points."""
+    
+    def _points(self, x1, y1, x2, y2):
+        """Line points as a list of (x, y) pairs."""
+        xs, ys = _line_points(x1, y1, x2, y2)
+        return list(zip(xs.tolist(), ys.tolist()))
+    
+    def test_zero_length_line(self):
+        """Test that a line from a point to itself is just that point."""
+        self.assertEqual(self._points(3, 4, 3, 4), [(3, 4)])
+        self.assertEqual(self._points(-2, 0, -2, 0), [(-2, 0)])
+    
+    def test_lines(self):
+        """Test shallow, steep and diagonal lines in both directions."""
+        self.assertEqual(self._points(0, 0, 4, 1), [(0, 0), (1, 0), (2, 0), (3, 1), (4, 1)])
+        self.assertEqual(self._points(0, 0, 1, 3), [(0, 0), (0, 1), (1, 2), (1, 3)])
+        self.assertEqual(self._points(2, 2, 0, 0), [(2, 2), (1, 1), (0, 0)])
+        self.assertEqual(self._points(0, 0, 0, -2), [(0, 0), (0, -1), (0, -2)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import sys
+import unittest
+
+import tcod.event
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.engine.input_handler import InputHandler, GameAction
+
+class TestInputHandler(unittest.TestCase):
+    """Test cases for InputHandler class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.handler = InputHandler()
+    
+    def test_quit_event(self):
+        """Test that closing the window maps to the quit action."""
+        result = self.handler.handle_event(tcod.event.Quit())
+        self.assertEqual(result["action"], GameAction.QUIT)
+    
+    def test_movement_key(self):
+        """Test that an arrow key maps to a movement action with its direction."""
+        event = tcod.event.KeyDown(
+            scancode=tcod.event.Scancode.UP,
+            sym=tcod.event.KeySym.UP,
+            mod=tcod.event.Modifier.NONE
+        )
+        result = self.handler.handle_event(event)
+        self.assertEqual(result["action"], GameAction.MOVE_UP)
+        self.assertEqual(result["direction"], "up")
+    
+    def test_mouse_motion(self):
+        """Test that mouse motion is reported only when the tile changes."""
+        event = tcod.event.MouseMotion(tile=tcod.event.Point(3, 4))
+        result = self.handler.handle_event(event)
+        self.assertEqual(result["mouse_position"], (3, 4))
+        self.assertEqual(self.handler.get_mouse_position(), (3, 4))
+        self.assertIsNone(self.handler.handle_event(event))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.engine.resources import Resource, Resources
+
+class TestResources(unittest.TestCase):
+    """Test cases for Resources class."""
+    
+    def test_round_trip(self):
+        """Test converting resources to a dictionary and back."""
+        resources = Resources(gold=100, food=50, water=40, rum=10, ammunition=20)
+        resources.rum = 12
+        
+        loaded = Resources.from_dict(resources.to_dict())
+        
+        self.assertEqual(loaded.to_dict(), resources.to_dict())
+        self.assertEqual(loaded.amounts[Resource.RUM], 12)
+        self.assertEqual(loaded["gold"], 100)
+    
+    def test_unknown_resource_on_load(self):
+        """Test that unknown names are logged rather than silently dropped."""
+        with self.assertLogs(level="WARNING") as logs:
+            loaded = Resources.from_dict({"gold": 5, "spices": 3})
+        
+        self.assertEqual(loaded["gold"], 5)
+        self.assertNotIn("spices", loaded.to_dict())
+        self.assertIn("spices", logs.output[0])
+    
+    def test_unknown_resource_set(self):
+        """Test that setting an unknown resource is rejected."""
+        resources = Resources()
+        with self.assertRaises(KeyError):
+            resources["spices"] = 3
+        self.assertEqual(resources.get("spices", 0), 0)
+
+if __name__ == "__main__":
+    unittest.main()
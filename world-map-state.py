@@ -86,8 +86,8 @@ class WorldMapState(State):
         
         # Draw ship info
         if self.game_state.player_fleet:
-            ship = self.game_state.player_fleet[0]
-            ship_text = f"Ship: {ship['name']} ({ship['type']}) - Crew: {ship['crew']}"
+            fleet = self.game_state.player_fleet
+            ship_text = f"Ship: {fleet.names[0]} ({fleet.types[0]}) - Crew: {fleet.crew[0]}"
             console.print(
                 5,
                 11,